@@ -6,20 +6,24 @@ Desktop application for Seebeck, Resistivity, and Thermal Conductivity measureme
 
 import sys
 import os
+import multiprocessing
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPalette, QColor
-from src.gui.main_window import MainWindow
-from src.database import init_database, create_tables
-from src.utils import Config, configure_cjk_fonts
-
 
 def main():
     """Main application entry point"""
+    # Imported here rather than at module level: the IR camera capture
+    # process is spawned and re-imports this module as __mp_main__, and it
+    # must not pull in Qt, the GUI and the database layer on every start
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtGui import QPalette, QColor
+    from src.gui.main_window import MainWindow
+    from src.database import init_database, create_tables
+    from src.utils import Config, configure_cjk_fonts
+
     # Configure matplotlib for CJK font support (must be done before any matplotlib imports)
     configure_cjk_fonts()
     
@@ -74,5 +78,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # Needed for the IR camera capture process in frozen (packaged) builds
+    multiprocessing.freeze_support()
     main()
 
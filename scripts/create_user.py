@@ -38,7 +38,7 @@ def select_lab(db, role: UserRole) -> int | None:
     if role == UserRole.SUPER_ADMIN:
         return None
 
-    labs = db.query(Lab).filter(Lab.is_active == True).order_by(Lab.id.asc()).all()  # noqa: E712
+    labs = db.query(Lab).filter(Lab.is_active.is_(True)).order_by(Lab.id.asc()).all()
     if not labs:
         print("No labs found. Please create a lab first (via super admin) before creating this user.")
         sys.exit(1)
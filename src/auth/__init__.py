@@ -1,5 +1,11 @@
-from .auth_manager import AuthManager
-from .session import SessionManager, CurrentSession
+from .auth_manager import AuthManager, get_auth_manager
+from .session import SessionManager, CurrentSession, get_session_manager
 
-__all__ = ['AuthManager', 'SessionManager', 'CurrentSession']
+__all__ = [
+    'AuthManager',
+    'get_auth_manager',
+    'SessionManager',
+    'CurrentSession',
+    'get_session_manager',
+]
 
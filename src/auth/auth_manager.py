@@ -137,3 +137,13 @@ class AuthManager:
         finally:
             db.close()
 
+
+_default_auth_manager: AuthManager | None = None
+
+
+def get_auth_manager() -> AuthManager:
+    """Get the shared AuthManager, creating it (and reading config) once"""
+    global _default_auth_manager
+    if _default_auth_manager is None:
+        _default_auth_manager = AuthManager()
+    return _default_auth_manager
@@ -95,3 +95,13 @@ class SessionManager:
         """Get current language context"""
         return self.session.get_language()
 
+
+_default_session_manager: Optional[SessionManager] = None
+
+
+def get_session_manager() -> SessionManager:
+    """Get the shared SessionManager, creating it once"""
+    global _default_session_manager
+    if _default_session_manager is None:
+        _default_session_manager = SessionManager()
+    return _default_session_manager
@@ -2,6 +2,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from configparser import ConfigParser
+from contextlib import contextmanager
 import os
 
 Base = declarative_base()
@@ -60,6 +61,25 @@ def get_db():
         db.close()
 
 
+@contextmanager
+def get_db_session():
+    """Context manager for a database session.
+
+    Rolls back on exception and always closes the session.
+    """
+    if SessionLocal is None:
+        init_database()
+
+    db = SessionLocal()
+    try:
+        yield db
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
 def create_tables():
     """Create all database tables"""
     if engine is None:
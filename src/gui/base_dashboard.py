@@ -3,11 +3,11 @@ Base Dashboard Class
 Provides common functionality for all role-based dashboards
 """
 
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
 
-from src.auth import SessionManager
+from src.auth import get_session_manager
+from src.gui.header_bar import HeaderBar
 from src.models import User
 from src.i18n import tr
 
@@ -22,7 +22,7 @@ class BaseDashboard(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.session_manager = SessionManager()
+        self.session_manager = get_session_manager()
         self.current_user = None
         self._setup_base_ui()
     
@@ -32,9 +32,9 @@ class BaseDashboard(QWidget):
         self.main_layout.setSpacing(10)
         self.main_layout.setContentsMargins(10, 10, 10, 10)
         
-        # Create header
-        self.header_widget = self._create_header()
-        self.main_layout.addWidget(self.header_widget)
+        # Shared header; attached to this dashboard in update_header()
+        self.header_widget = HeaderBar.shared()
+        self.header_widget.logout_requested.connect(self._on_header_logout)
         
         # Content area (to be populated by subclasses)
         self.content_layout = QVBoxLayout()
@@ -42,50 +42,15 @@ class BaseDashboard(QWidget):
         
         self.setLayout(self.main_layout)
     
-    def _create_header(self) -> QWidget:
-        """Create common header with welcome message and logout button"""
-        header_widget = QWidget()
-        header_layout = QHBoxLayout()
-        header_layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Welcome label (will be updated when user loads)
-        self.welcome_label = QLabel(tr("dashboard.welcome"))
-        welcome_font = QFont()
-        welcome_font.setPointSize(16)
-        welcome_font.setBold(True)
-        self.welcome_label.setFont(welcome_font)
-        header_layout.addWidget(self.welcome_label)
-        
-        # Role badge (optional, can be overridden)
-        # Will be created/refreshed in update_header() after login
-        self.role_badge = None
-        
-        header_layout.addStretch()
-        
-        # User info (optional)
-        self.user_info_label = QLabel()
-        self.user_info_label.setStyleSheet("color: #666; font-size: 11px;")
-        header_layout.addWidget(self.user_info_label)
-        
-        # Logout button
-        self.logout_button = QPushButton(tr("dashboard.logout"))
-        self.logout_button.setStyleSheet("""
-            QPushButton {
-                background-color: #dc3545;
-                color: white;
-                padding: 6px 15px;
-                border-radius: 4px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #c82333;
-            }
-        """)
-        self.logout_button.clicked.connect(self.logout_requested.emit)
-        header_layout.addWidget(self.logout_button)
-        
-        header_widget.setLayout(header_layout)
-        return header_widget
+    def _attach_header(self):
+        """Move the shared header into this dashboard (top of the layout)"""
+        if self.header_widget.parent() is not self:
+            self.main_layout.insertWidget(0, self.header_widget)
+    
+    def _on_header_logout(self):
+        """Forward logout clicks only from the dashboard hosting the header"""
+        if self.header_widget.parent() is self:
+            self.logout_requested.emit()
     
     def _create_role_badge(self) -> QLabel:
         """
@@ -93,6 +58,13 @@ class BaseDashboard(QWidget):
         Returns None if no badge needed.
         """
         return None
+
+    def _retranslate_role_badge(self, badge: QLabel):
+        """
+        Refresh the text of an existing role badge for the current language.
+        Override in subclasses whose badge text is translated.
+        """
+        pass
     
     def _get_role_display_name(self) -> str:
         """
@@ -114,28 +86,26 @@ class BaseDashboard(QWidget):
         user = self.session_manager.get_current_user()
         if user:
             self.current_user = user
+            header = self.header_widget
+            self._attach_header()
+
             # Translate welcome message with user's name
             welcome_text = tr("dashboard.welcome")
-            self.welcome_label.setText(f"{welcome_text}, {user.full_name}")
+            header.welcome_label.setText(f"{welcome_text}, {user.full_name}")
 
-            # Update role badge with translated text
-            if self.role_badge:
-                # Remove old badge
-                self.role_badge.setParent(None)
-            self.role_badge = self._create_role_badge()
-            if self.role_badge:
-                # Find the header layout and insert badge after welcome label
-                header_layout = self.header_widget.layout()
-                if header_layout:
-                    header_layout.insertWidget(1, self.role_badge)
+            # Update role badge with translated text. The badge only depends
+            # on the role, so keep the existing widget when it is unchanged.
+            if header.role_badge is not None and user.role == header.badge_role:
+                self._retranslate_role_badge(header.role_badge)
+            else:
+                header.set_role_badge(self._create_role_badge(), user.role)
 
             # Update logout button text
-            if hasattr(self, 'logout_button') and self.logout_button:
-                self.logout_button.setText(tr("dashboard.logout"))
+            header.logout_button.setText(tr("dashboard.logout"))
 
             # For now, only show the role in the header to avoid lazy-loading
             # relationships (like user.lab) on detached instances.
-            self.user_info_label.setText(self._get_role_display_name())
+            header.user_info_label.setText(self._get_role_display_name())
     
     def load_data(self):
         """
@@ -0,0 +1,38 @@
+"""
+DB Worker
+Runs blocking work (database queries, password hashing) on the global
+QThreadPool and reports the result back to the GUI thread via signals.
+"""
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+
+class WorkerSignals(QObject):
+    """Signals emitted by DbWorker (delivered queued on the GUI thread)"""
+
+    finished = pyqtSignal(object)  # return value of the wrapped function
+    failed = pyqtSignal(object)  # exception raised by the wrapped function
+
+
+class DbWorker(QRunnable):
+    """
+    Run ``fn(*args, **kwargs)`` on a worker thread.
+
+    The wrapped function must not touch Qt widgets and must open its own
+    DB session (sessions are not shared across threads).
+    """
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.failed.emit(e)
+        else:
+            self.signals.finished.emit(result)
@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 
 from src.database import get_db
 from src.models import Lab
+from src.services.lab_cache import invalidate_active_labs
 
 
 class CreateLabDialog(QDialog):
@@ -19,6 +20,8 @@ class CreateLabDialog(QDialog):
     
     def init_ui(self):
         """Initialize UI components"""
+        # Defer layout/repaint work until all form rows have been added
+        self.setUpdatesEnabled(False)
         self.setWindowTitle("Create New Lab")
         self.setMinimumWidth(500)
         
@@ -73,6 +76,7 @@ class CreateLabDialog(QDialog):
         layout.addLayout(button_layout)
         
         self.setLayout(layout)
+        self.setUpdatesEnabled(True)
     
     def create_lab(self):
         """Create the lab"""
@@ -106,6 +110,7 @@ class CreateLabDialog(QDialog):
             db.add(new_lab)
             db.commit()
             db.refresh(new_lab)
+            invalidate_active_labs()
             
             self.created_lab = new_lab
             
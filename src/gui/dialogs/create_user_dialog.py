@@ -9,16 +9,39 @@ from PyQt6.QtWidgets import (
     QComboBox,
     QMessageBox,
     QTextEdit,
-    QApplication,
 )
-from PyQt6.QtCore import Qt
-from sqlalchemy.orm import Session
-import secrets
-import string
+from PyQt6.QtCore import QThreadPool, QTimer, QRegularExpression
+from PyQt6.QtGui import QRegularExpressionValidator
+from sqlalchemy import or_
 
-from src.database import get_db
-from src.models import User, UserRole, Lab
-from src.auth import AuthManager
+from src.database import get_db_session
+from src.models import User, UserRole
+from src.auth import AuthManager, get_auth_manager
+from src.utils import generate_password
+from src.gui.db_worker import DbWorker
+from src.gui.dialogs.credentials_dialog import show_credentials_dialog
+from src.gui.dialogs.user_form import (
+    LAB_REQUIRED_ROLES,
+    ROLE_ENUM_TO_TEXT,
+    ROLE_TEXT_TO_ENUM,
+    build_lab_model,
+)
+
+
+# Loose syntactic email check (something@something, no spaces)
+_EMAIL_RE = QRegularExpression(r"^[^@\s]+@[^@\s]+$")
+
+_PRIMARY_BTN_QSS = """
+    QPushButton {
+        background-color: #0078d4;
+        color: white;
+        padding: 8px 20px;
+        border-radius: 4px;
+    }
+    QPushButton:hover {
+        background-color: #005a9e;
+    }
+"""
 
 
 class CreateUserDialog(QDialog):
@@ -29,16 +52,23 @@ class CreateUserDialog(QDialog):
         parent=None,
         preset_role: UserRole | None = None,
         preset_lab_id: int | None = None,
+        auth_manager: AuthManager | None = None,
     ):
         super().__init__(parent)
-        self.auth_manager = AuthManager()
+        self.auth_manager = auth_manager or get_auth_manager()
         self.created_user = None
         self._preset_role = preset_role
         self._preset_lab_id = preset_lab_id
+        self._labs_loaded = False
+        self._lab_locked = False
+        # In-flight create worker; None when idle
+        self._worker: DbWorker | None = None
         self.init_ui()
     
     def init_ui(self):
         """Initialize UI components"""
+        # Defer layout/repaint work until all form rows have been added
+        self.setUpdatesEnabled(False)
         self.setWindowTitle("Create New User")
         self.setMinimumWidth(500)
         
@@ -71,6 +101,7 @@ class CreateUserDialog(QDialog):
         # Email
         self.email_input = QLineEdit()
         self.email_input.setPlaceholderText("Enter email address")
+        self.email_input.setValidator(QRegularExpressionValidator(_EMAIL_RE, self))
         form_layout.addRow("Email *:", self.email_input)
         
         # Role
@@ -79,13 +110,16 @@ class CreateUserDialog(QDialog):
         form_layout.addRow("Role *:", self.role_combo)
 
         # Lab (for researchers and lab admins)
+        # Labs are loaded when the dialog is first shown with a role that
+        # needs a lab (see showEvent/_on_role_changed)
         self.lab_combo = QComboBox()
         self.lab_combo.addItem("Select Lab", None)
-        self.load_labs()
         form_layout.addRow("Lab *:", self.lab_combo)
         
-        # Apply any presets for role/lab after combos are populated
+        # Apply any preset role (the preset lab is applied in load_labs)
         self._apply_presets()
+        self.role_combo.currentTextChanged.connect(self._on_role_changed)
+        self._on_role_changed(self.role_combo.currentText())
 
         layout.addLayout(form_layout)
         
@@ -93,38 +127,74 @@ class CreateUserDialog(QDialog):
         button_layout = QHBoxLayout()
         button_layout.addStretch()
         
-        cancel_button = QPushButton("Cancel")
-        cancel_button.clicked.connect(self.reject)
-        button_layout.addWidget(cancel_button)
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.reject)
+        button_layout.addWidget(self.cancel_button)
         
-        create_button = QPushButton("Create User")
-        create_button.setStyleSheet("""
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                padding: 8px 20px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #005a9e;
-            }
-        """)
-        create_button.clicked.connect(self.create_user)
-        button_layout.addWidget(create_button)
+        self.create_button = QPushButton("Create User")
+        self.create_button.setStyleSheet(_PRIMARY_BTN_QSS)
+        self.create_button.clicked.connect(self.create_user)
+        button_layout.addWidget(self.create_button)
+
+        # Only enable Create once the required fields are filled in
+        for line_edit in (self.full_name_input, self.username_input, self.email_input):
+            line_edit.textChanged.connect(self._revalidate)
+        self._revalidate()
         
         layout.addLayout(button_layout)
         
         self.setLayout(layout)
+        self.setUpdatesEnabled(True)
+
+    def _revalidate(self):
+        """Enable the Create button only when required inputs are valid.
+
+        Stays disabled while a create is in flight, so editing the form
+        cannot start a second insert.
+        """
+        ok = bool(
+            self.full_name_input.text().strip()
+            and self.username_input.text().strip()
+            and self.email_input.hasAcceptableInput()
+        )
+        self.create_button.setEnabled(ok and self._worker is None)
+
+    def reject(self):
+        """Cancel the dialog unless a create is in flight.
+
+        Esc and the close button also land here. A pending create still
+        finishes, and its credentials must be shown, so it is not dropped.
+        """
+        if self._worker is not None:
+            return
+        super().reject()
+
+    def _role_needs_lab(self) -> bool:
+        return ROLE_TEXT_TO_ENUM[self.role_combo.currentText()] in LAB_REQUIRED_ROLES
+
+    def _on_role_changed(self, role_text: str):
+        """Disable the lab combo for super admins; load labs when first needed."""
+        needs_lab = self._role_needs_lab()
+        self.lab_combo.setEnabled(needs_lab and not self._lab_locked)
+        if needs_lab and self.isVisible():
+            self._ensure_labs_loaded()
+
+    def _ensure_labs_loaded(self):
+        """Schedule the lab load once, after pending paint events."""
+        if not self._labs_loaded:
+            self._labs_loaded = True
+            QTimer.singleShot(0, self.load_labs)
+
+    def showEvent(self, event):
+        """Load labs on first show, after the dialog has painted."""
+        super().showEvent(event)
+        if self._role_needs_lab():
+            self._ensure_labs_loaded()
 
     def _apply_presets(self):
         """Apply optional preset role/lab (used from lab profile window)."""
         if self._preset_role is not None:
-            role_text_map = {
-                UserRole.RESEARCHER: "Researcher",
-                UserRole.LAB_ADMIN: "Lab Admin",
-                UserRole.SUPER_ADMIN: "Super Admin",
-            }
-            text = role_text_map.get(self._preset_role)
+            text = ROLE_ENUM_TO_TEXT.get(self._preset_role)
             if text:
                 index = self.role_combo.findText(text)
                 if index >= 0:
@@ -137,19 +207,15 @@ class CreateUserDialog(QDialog):
             if index >= 0:
                 self.lab_combo.setCurrentIndex(index)
                 # Lock lab to keep user tied to this lab
+                self._lab_locked = True
                 self.lab_combo.setEnabled(False)
     
     def load_labs(self):
-        """Load available labs"""
-        db = next(get_db())
-        try:
-            labs = db.query(Lab).filter(Lab.is_active == True).all()
-            for lab in labs:
-                self.lab_combo.addItem(lab.name, lab.id)
-        except Exception as e:
-            print(f"Error loading labs: {e}")
-        finally:
-            db.close()
+        """Load available labs (after the "Select Lab" placeholder)"""
+        self.lab_combo.setModel(build_lab_model(self.lab_combo))
+
+        # Preset lab can only be selected once the labs are present
+        self._apply_presets()
     
     def create_user(self):
         """Create the user.
@@ -165,40 +231,55 @@ class CreateUserDialog(QDialog):
         lab_id = self.lab_combo.currentData()
         
         # Validation
-        if not all([full_name, username, email]):
+        if not (full_name and username and email):
             QMessageBox.warning(self, "Validation Error", "Please fill in all required fields")
             return
         
         # Map role text to enum
-        role_map = {
-            "Researcher": UserRole.RESEARCHER,
-            "Lab Admin": UserRole.LAB_ADMIN,
-            "Super Admin": UserRole.SUPER_ADMIN
-        }
-        role = role_map[role_text]
+        role = ROLE_TEXT_TO_ENUM[role_text]
         
         # Lab is required for researchers and lab admins
-        if role in [UserRole.RESEARCHER, UserRole.LAB_ADMIN] and not lab_id:
+        if role in LAB_REQUIRED_ROLES and not lab_id:
             QMessageBox.warning(self, "Validation Error", "Please select a lab for this user")
             return
         
-        # Create user
-        db = next(get_db())
-        try:
-            # Check if username already exists
-            existing_user = db.query(User).filter(User.username == username).first()
-            if existing_user:
-                QMessageBox.warning(self, "Error", f"Username '{username}' already exists")
-                return
+        # Create user on a worker thread (DB round-trips + bcrypt hashing)
+        self.create_button.setEnabled(False)
+        self.cancel_button.setEnabled(False)
+        self._worker = DbWorker(
+            self._do_create_user, full_name, username, email, role, lab_id
+        )
+        self._worker.signals.finished.connect(self._on_user_created)
+        self._worker.signals.failed.connect(self._on_create_failed)
+        QThreadPool.globalInstance().start(self._worker)
+
+    def _do_create_user(
+        self, full_name: str, username: str, email: str, role: UserRole, lab_id
+    ) -> tuple[User, str]:
+        """Insert the new user (runs on a worker thread, no widget access).
+
+        Returns the created user and its generated plaintext password.
+        Raises ValueError if the username or email is already taken.
+        """
+        with get_db_session() as db:
+            # Check username and email uniqueness in a single query
+            # (users.username/users.email are unique-indexed, so at most
+            # two rows can match; the DB constraint remains the real
+            # guard against races)
+            taken = (
+                db.query(User.username, User.email)
+                .filter(or_(User.username == username, User.email == email))
+                .limit(2)
+                .all()
+            )
+            if any(row.username == username for row in taken):
+                raise ValueError(f"Username '{username}' already exists")
             
-            # Check if email already exists
-            existing_email = db.query(User).filter(User.email == email).first()
-            if existing_email:
-                QMessageBox.warning(self, "Error", f"Email '{email}' is already registered")
-                return
+            if any(row.email == email for row in taken):
+                raise ValueError(f"Email '{email}' is already registered")
 
             # Generate a unique random password (8–16 chars, alphanumeric)
-            password = self._generate_unique_password(db)
+            password = self._generate_unique_password()
             
             # Create new user
             new_user = User(
@@ -212,61 +293,46 @@ class CreateUserDialog(QDialog):
             new_user.set_password(password)
             
             db.add(new_user)
+            # Flush assigns the primary key; detaching before commit keeps
+            # the loaded attributes from being expired, so the caller can
+            # read them without a refresh SELECT.
+            db.flush()
+            db.expunge(new_user)
             db.commit()
-            db.refresh(new_user)
-            
-            self.created_user = new_user
+            return new_user, password
 
-            # Enhanced success dialog with styled credentials and copy support
-            msg = QMessageBox(self)
-            msg.setWindowTitle("User Created")
-            msg.setIcon(QMessageBox.Icon.Information)
-            msg.setTextFormat(Qt.TextFormat.RichText)
-            msg.setText(
-                "<b>User '{username}' created successfully.</b><br><br>"
-                "<span style='color:#555;'>Provide these credentials to the user. "
-                "<b>The password will only be shown once.</b></span><br><br>"
-                "<table style='font-size:12px;'>"
-                "<tr><td align='right'><b>Username:&nbsp;</b></td>"
-                "<td><code style='background-color:#f5f5f5; padding:2px 6px;'>{username}</code></td></tr>"
-                "<tr><td align='right'><b>Password:&nbsp;</b></td>"
-                "<td><code style='background-color:#fff3cd; padding:2px 6px;'>{password}</code></td></tr>"
-                "</table>"
-            .format(username=username, password=password)
-            )
-            msg.setStandardButtons(QMessageBox.StandardButton.Ok)
-            copy_btn = msg.addButton(
-                "Copy Password", QMessageBox.ButtonRole.ActionRole
-            )
+    def _on_user_created(self, result: tuple[User, str]):
+        """Show the one-time credentials and close the dialog"""
+        self._worker = None
+        self.cancel_button.setEnabled(True)
+        new_user, password = result
+        username = new_user.username
+        self.created_user = new_user
 
-            msg.exec()
+        show_credentials_dialog(
+            self,
+            "User Created",
+            f"User '{username}' created successfully.",
+            username,
+            password,
+        )
 
-            if msg.clickedButton() == copy_btn:
-                QApplication.clipboard().setText(password)
+        self.accept()
 
-            self.accept()
-            
-        except Exception as e:
-            db.rollback()
-            QMessageBox.critical(self, "Error", f"Failed to create user: {str(e)}")
-        finally:
-            db.close()
+    def _on_create_failed(self, error: Exception):
+        """Report a failed create and let the user retry"""
+        self._worker = None
+        self.cancel_button.setEnabled(True)
+        self._revalidate()
+        if isinstance(error, ValueError):
+            QMessageBox.warning(self, "Error", str(error))
+        else:
+            QMessageBox.critical(self, "Error", f"Failed to create user: {str(error)}")
 
-    def _generate_unique_password(self, db: Session, min_len: int = 8, max_len: int = 16) -> str:
-        """Generate a unique, random alphanumeric password.
+    def _generate_unique_password(self, min_len: int = 8, max_len: int = 16) -> str:
+        """Generate a random alphanumeric password.
 
-        Ensures (with extremely high probability) that no existing user's
-        password matches by checking against all stored password hashes.
+        No database check is needed: passwords are stored as salted hashes,
+        and a collision in a 62**8+ space is negligible.
         """
-        alphabet = string.ascii_letters + string.digits
-        length_range = list(range(min_len, max_len + 1))
-
-        while True:
-            length = secrets.choice(length_range)
-            candidate = "".join(secrets.choice(alphabet) for _ in range(length))
-
-            # Check uniqueness vs existing users' passwords
-            users = db.query(User).all()
-            if all(not u.check_password(candidate) for u in users):
-                return candidate
-
+        return generate_password(min_len, max_len)
@@ -0,0 +1,59 @@
+from PyQt6.QtWidgets import QMessageBox, QApplication, QWidget
+from PyQt6.QtCore import Qt, QTimer
+
+
+# Clear a copied password from the clipboard after this many milliseconds
+CLIPBOARD_CLEAR_MS = 30_000
+
+_CREDENTIALS_TEMPLATE = (
+    "<b>{heading}</b><br><br>"
+    "<span style='color:#555;'>Provide these {qualifier}credentials to the user. "
+    "<b>The password will only be shown once.</b></span><br><br>"
+    "<table style='font-size:12px;'>"
+    "<tr><td align='right'><b>Username:&nbsp;</b></td>"
+    "<td><code style='background-color:#f5f5f5; padding:2px 6px;'>{username}</code></td></tr>"
+    "<tr><td align='right'><b>Password:&nbsp;</b></td>"
+    "<td><code style='background-color:#fff3cd; padding:2px 6px;'>{password}</code></td></tr>"
+    "</table>"
+)
+
+
+def show_credentials_dialog(
+    parent: QWidget,
+    title: str,
+    heading: str,
+    username: str,
+    password: str,
+    new_credentials: bool = False,
+):
+    """Show one-time credentials with a "Copy Password" button.
+
+    A copied password is removed from the clipboard again after
+    CLIPBOARD_CLEAR_MS, unless something else was copied in the meantime.
+    """
+    msg = QMessageBox(parent)
+    msg.setWindowTitle(title)
+    msg.setIcon(QMessageBox.Icon.Information)
+    msg.setTextFormat(Qt.TextFormat.RichText)
+    msg.setText(
+        _CREDENTIALS_TEMPLATE.format(
+            heading=heading,
+            qualifier="new " if new_credentials else "",
+            username=username,
+            password=password,
+        )
+    )
+    msg.setStandardButtons(QMessageBox.StandardButton.Ok)
+    copy_btn = msg.addButton("Copy Password", QMessageBox.ButtonRole.ActionRole)
+
+    msg.exec()
+
+    if msg.clickedButton() == copy_btn:
+        clipboard = QApplication.clipboard()
+        clipboard.setText(password)
+
+        def _clear_clipboard():
+            if clipboard.text() == password:
+                clipboard.clear()
+
+        QTimer.singleShot(CLIPBOARD_CLEAR_MS, _clear_clipboard)
@@ -9,15 +9,50 @@ from PyQt6.QtWidgets import (
     QComboBox,
     QMessageBox,
     QCheckBox,
-    QApplication,
 )
-from PyQt6.QtCore import Qt
-from sqlalchemy.orm import Session
-import secrets
-import string
+from PyQt6.QtCore import Qt, QThreadPool
+from sqlalchemy.orm import raiseload
+from types import SimpleNamespace
+
+from src.database import get_db_session
+from src.models import User, UserRole
+from src.utils import generate_password
+from src.gui.db_worker import DbWorker
+from src.gui.dialogs.credentials_dialog import show_credentials_dialog
+from src.gui.dialogs.user_form import (
+    LAB_REQUIRED_ROLES,
+    ROLE_ENUM_TO_TEXT,
+    ROLE_TEXT_TO_ENUM,
+    build_lab_model,
+)
+
 
-from src.database import get_db
-from src.models import User, UserRole, Lab
+# Language combo entries as (label, code)
+_LANGUAGES = (("English", "en"), ("日本語", "ja"))
+
+_WARN_BTN_QSS = """
+    QPushButton {
+        background-color: #ffc107;
+        color: #000;
+        padding: 6px 16px;
+        border-radius: 4px;
+    }
+    QPushButton:hover {
+        background-color: #e0a800;
+    }
+"""
+
+_PRIMARY_BTN_QSS = """
+    QPushButton {
+        background-color: #0078d4;
+        color: white;
+        padding: 8px 20px;
+        border-radius: 4px;
+    }
+    QPushButton:hover {
+        background-color: #005a9e;
+    }
+"""
 
 
 class EditUserDialog(QDialog):
@@ -26,10 +61,18 @@ class EditUserDialog(QDialog):
     def __init__(self, user_id: int, parent=None):
         super().__init__(parent)
         self.user_id = user_id
-        self.user: User | None = None
+        # Lightweight snapshot of the displayed user columns
+        self.user: SimpleNamespace | None = None
+        # Password hashing worker; cleared once the dialog has finished
+        self._worker: DbWorker | None = None
         self.init_ui()
         self.load_user()
 
+    def done(self, result):
+        """Drop any pending password reset on accept/reject/close."""
+        self._worker = None
+        super().done(result)
+
     def init_ui(self):
         self.setWindowTitle("Edit User")
         self.setMinimumWidth(520)
@@ -67,19 +110,21 @@ class EditUserDialog(QDialog):
 
         # Role
         self.role_combo = QComboBox()
-        self.role_combo.addItems(["Researcher", "Lab Admin", "Super Admin"])
+        self.role_combo.addItems(list(ROLE_TEXT_TO_ENUM))
+        # Text/data -> combo index maps, so load_user avoids findText/findData
+        self._role_idx = {text: i for i, text in enumerate(ROLE_TEXT_TO_ENUM)}
         form_layout.addRow("Role *:", self.role_combo)
 
         # Lab (for researchers and lab admins)
         self.lab_combo = QComboBox()
-        self.lab_combo.addItem("Select Lab", None)
         self._load_labs()
         form_layout.addRow("Lab *:", self.lab_combo)
 
         # Preferred language
         self.language_combo = QComboBox()
-        self.language_combo.addItem("English", "en")
-        self.language_combo.addItem("日本語", "ja")
+        for label, code in _LANGUAGES:
+            self.language_combo.addItem(label, code)
+        self._lang_idx = {code: i for i, (_, code) in enumerate(_LANGUAGES)}
         form_layout.addRow("Preferred Language:", self.language_combo)
 
         # Status flags
@@ -101,22 +146,10 @@ class EditUserDialog(QDialog):
         # Buttons
         button_layout = QHBoxLayout()
 
-        reset_button = QPushButton("Reset Password")
-        reset_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #ffc107;
-                color: #000;
-                padding: 6px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #e0a800;
-            }
-            """
-        )
-        reset_button.clicked.connect(self.reset_password)
-        button_layout.addWidget(reset_button)
+        self.reset_button = QPushButton("Reset Password")
+        self.reset_button.setStyleSheet(_WARN_BTN_QSS)
+        self.reset_button.clicked.connect(self.reset_password)
+        button_layout.addWidget(self.reset_button)
 
         button_layout.addStretch()
 
@@ -125,19 +158,7 @@ class EditUserDialog(QDialog):
         button_layout.addWidget(cancel_button)
 
         save_button = QPushButton("Save Changes")
-        save_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                padding: 8px 20px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #005a9e;
-            }
-            """
-        )
+        save_button.setStyleSheet(_PRIMARY_BTN_QSS)
         save_button.clicked.connect(self.save_changes)
         button_layout.addWidget(save_button)
 
@@ -146,51 +167,62 @@ class EditUserDialog(QDialog):
         self.setLayout(layout)
 
     def _load_labs(self):
-        db = next(get_db())
-        try:
-            labs = db.query(Lab).filter(Lab.is_active == True).all()  # noqa: E712
-            for lab in labs:
-                self.lab_combo.addItem(lab.name, lab.id)
-        except Exception as e:
-            print(f"Error loading labs: {e}")
-        finally:
-            db.close()
+        model = build_lab_model(self.lab_combo)
+        self.lab_combo.setModel(model)
+        # Lab id -> combo index, skipping the "Select Lab" placeholder
+        self._lab_idx_by_id = {
+            model.item(i).data(Qt.ItemDataRole.UserRole): i
+            for i in range(1, model.rowCount())
+        }
 
     def load_user(self):
         """Populate form fields with existing user data."""
-        db = next(get_db())
         try:
-            user = db.query(User).filter(User.id == self.user_id).first()
-            if not user:
+            # Only the displayed columns are needed; the full ORM object
+            # is fetched in save_changes when it is actually mutated.
+            with get_db_session() as db:
+                row = (
+                    db.query(
+                        User.id,
+                        User.username,
+                        User.email,
+                        User.full_name,
+                        User.role,
+                        User.lab_id,
+                        User.preferred_language,
+                        User.is_active,
+                        User.is_locked,
+                        User.last_login,
+                    )
+                    .filter(User.id == self.user_id)
+                    .first()
+                )
+            if not row:
                 QMessageBox.warning(self, "Not Found", "User not found.")
                 self.reject()
                 return
 
+            user = SimpleNamespace(**row._asdict())
             self.user = user
             self.full_name_input.setText(user.full_name or "")
             self.username_display.setText(user.username or "")
             self.email_input.setText(user.email or "")
 
             # Role
-            role_text_map = {
-                UserRole.RESEARCHER: "Researcher",
-                UserRole.LAB_ADMIN: "Lab Admin",
-                UserRole.SUPER_ADMIN: "Super Admin",
-            }
-            role_text = role_text_map.get(user.role, "Researcher")
-            idx = self.role_combo.findText(role_text)
+            role_text = ROLE_ENUM_TO_TEXT.get(user.role, "Researcher")
+            idx = self._role_idx.get(role_text, -1)
             if idx >= 0:
                 self.role_combo.setCurrentIndex(idx)
 
             # Lab
             if user.lab_id:
-                lab_idx = self.lab_combo.findData(user.lab_id)
+                lab_idx = self._lab_idx_by_id.get(user.lab_id, -1)
                 if lab_idx >= 0:
                     self.lab_combo.setCurrentIndex(lab_idx)
 
             # Preferred language
             lang_code = user.preferred_language or "en"
-            lang_idx = self.language_combo.findData(lang_code)
+            lang_idx = self._lang_idx.get(lang_code, -1)
             if lang_idx >= 0:
                 self.language_combo.setCurrentIndex(lang_idx)
 
@@ -208,8 +240,6 @@ class EditUserDialog(QDialog):
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load user: {str(e)}")
-        finally:
-            db.close()
 
     def save_changes(self):
         """Validate and persist user changes."""
@@ -230,115 +260,112 @@ class EditUserDialog(QDialog):
             )
             return
 
-        role_map = {
-            "Researcher": UserRole.RESEARCHER,
-            "Lab Admin": UserRole.LAB_ADMIN,
-            "Super Admin": UserRole.SUPER_ADMIN,
-        }
-        role = role_map[role_text]
+        role = ROLE_TEXT_TO_ENUM[role_text]
 
-        if role in [UserRole.RESEARCHER, UserRole.LAB_ADMIN] and not lab_id:
+        if role in LAB_REQUIRED_ROLES and not lab_id:
             QMessageBox.warning(
                 self, "Validation Error", "Please select a lab for this user."
             )
             return
 
-        db = next(get_db())
         try:
-            user = db.query(User).filter(User.id == self.user_id).first()
-            if not user:
-                QMessageBox.warning(self, "Not Found", "User not found.")
-                return
-
-            user.full_name = full_name
-            user.email = email
-            user.role = role
-            user.lab_id = lab_id if role != UserRole.SUPER_ADMIN else None
-            user.is_active = is_active
-            user.is_locked = is_locked
-            user.preferred_language = preferred_language or "en"
-
-            db.commit()
-            db.refresh(user)
-            self.user = user
-
-            QMessageBox.information(
-                self,
-                "User Updated",
-                "User details have been updated successfully.",
-            )
-            self.accept()
-
+            with get_db_session() as db:
+                # Nothing here touches relationships; raiseload makes any
+                # accidental lazy load (e.g. user.lab) fail loudly instead
+                # of issuing a hidden per-attribute SELECT.
+                user = db.get(User, self.user_id, options=[raiseload("*")])
+                if not user:
+                    QMessageBox.warning(self, "Not Found", "User not found.")
+                    return
+
+                user.full_name = full_name
+                user.email = email
+                user.role = role
+                user.lab_id = lab_id if role != UserRole.SUPER_ADMIN else None
+                user.is_active = is_active
+                user.is_locked = is_locked
+                user.preferred_language = preferred_language or "en"
+
+                db.commit()
         except Exception as e:
-            db.rollback()
             QMessageBox.critical(self, "Error", f"Failed to update user: {str(e)}")
-        finally:
-            db.close()
+            return
+
+        QMessageBox.information(
+            self,
+            "User Updated",
+            "User details have been updated successfully.",
+        )
+        self.accept()
 
     def reset_password(self):
         """Generate and set a new unique password, then show it once."""
-        db = next(get_db())
-        try:
-            user = db.query(User).filter(User.id == self.user_id).first()
-            if not user:
-                QMessageBox.warning(self, "Not Found", "User not found.")
-                return
+        if not self.user:
+            return
 
-            new_password = self._generate_unique_password(db)
-
-            user.set_password(new_password)
-            user.is_locked = False
-            user.failed_login_attempts = 0
-
-            db.commit()
-
-            # Show styled one-time password dialog
-            msg = QMessageBox(self)
-            msg.setWindowTitle("Password Reset")
-            msg.setIcon(QMessageBox.Icon.Information)
-            msg.setTextFormat(Qt.TextFormat.RichText)
-            msg.setText(
-                "<b>Password reset successfully.</b><br><br>"
-                "<span style='color:#555;'>Provide these new credentials to the user. "
-                "<b>The password will only be shown once.</b></span><br><br>"
-                "<table style='font-size:12px;'>"
-                "<tr><td align='right'><b>Username:&nbsp;</b></td>"
-                "<td><code style='background-color:#f5f5f5; padding:2px 6px;'>{username}</code></td></tr>"
-                "<tr><td align='right'><b>Password:&nbsp;</b></td>"
-                "<td><code style='background-color:#fff3cd; padding:2px 6px;'>{password}</code></td></tr>"
-                "</table>".format(username=user.username, password=new_password)
-            )
-            msg.setStandardButtons(QMessageBox.StandardButton.Ok)
-            copy_btn = msg.addButton(
-                "Copy Password", QMessageBox.ButtonRole.ActionRole
-            )
+        # Only the bcrypt hash runs on a worker thread; the result is
+        # committed back on the GUI thread
+        self.reset_button.setEnabled(False)
+        self._worker = DbWorker(self._hash_new_password)
+        self._worker.signals.finished.connect(self._on_password_hashed)
+        self._worker.signals.failed.connect(self._on_reset_failed)
+        QThreadPool.globalInstance().start(self._worker)
+
+    def _hash_new_password(self) -> tuple[str, str]:
+        """Generate and hash a new password (worker thread, no DB/widgets).
+
+        Returns the plaintext password and its hash.
+        """
+        new_password = self._generate_unique_password()
+        return new_password, User.hash_password(new_password)
+
+    def _on_password_hashed(self, result: tuple[str, str]):
+        """Store the new hash and show the one-time password"""
+        # Ignore a result that arrives after the dialog was closed
+        if self._worker is None or self.sender() is not self._worker.signals:
+            return
+        new_password, password_hash = result
+        self.reset_button.setEnabled(True)
 
-            msg.exec()
+        try:
+            with get_db_session() as db:
+                user = db.get(User, self.user_id, options=[raiseload("*")])
+                if not user:
+                    QMessageBox.warning(self, "Not Found", "User not found.")
+                    return
+
+                user.password_hash = password_hash
+                user.is_locked = False
+                user.failed_login_attempts = 0
+                db.commit()
+        except Exception as e:
+            self._on_reset_failed(e)
+            return
 
-            if msg.clickedButton() == copy_btn:
-                QApplication.clipboard().setText(new_password)
+        show_credentials_dialog(
+            self,
+            "Password Reset",
+            "Password reset successfully.",
+            self.user.username,
+            new_password,
+            new_credentials=True,
+        )
 
-        except Exception as e:
-            db.rollback()
-            QMessageBox.critical(
-                self, "Error", f"Failed to reset password: {str(e)}"
-            )
-        finally:
-            db.close()
+    def _on_reset_failed(self, error: Exception):
+        """Report a failed password reset"""
+        if self._worker is None:
+            return
+        self.reset_button.setEnabled(True)
+        QMessageBox.critical(
+            self, "Error", f"Failed to reset password: {str(error)}"
+        )
 
     def _generate_unique_password(
-        self, db: Session, min_len: int = 8, max_len: int = 16
+        self, min_len: int = 8, max_len: int = 16
     ) -> str:
-        """Generate a unique, random alphanumeric password."""
-        alphabet = string.ascii_letters + string.digits
-        length_range = list(range(min_len, max_len + 1))
-
-        while True:
-            length = secrets.choice(length_range)
-            candidate = "".join(secrets.choice(alphabet) for _ in range(length))
-
-            users = db.query(User).all()
-            if all(not u.check_password(candidate) for u in users):
-                return candidate
-
+        """Generate a random alphanumeric password.
 
+        No database check is needed: passwords are stored as salted hashes,
+        and a collision in a 62**8+ space is negligible.
+        """
+        return generate_password(min_len, max_len)
@@ -0,0 +1,42 @@
+"""Shared pieces of the create and edit user dialogs."""
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QStandardItemModel, QStandardItem
+from types import MappingProxyType
+
+from src.models import UserRole
+from src.services.lab_cache import get_active_labs
+
+
+# Role combo text <-> enum lookup tables
+ROLE_TEXT_TO_ENUM = MappingProxyType({
+    "Researcher": UserRole.RESEARCHER,
+    "Lab Admin": UserRole.LAB_ADMIN,
+    "Super Admin": UserRole.SUPER_ADMIN,
+})
+ROLE_ENUM_TO_TEXT = MappingProxyType(
+    {role: text for text, role in ROLE_TEXT_TO_ENUM.items()}
+)
+# Roles that must be assigned to a lab
+LAB_REQUIRED_ROLES = frozenset({UserRole.RESEARCHER, UserRole.LAB_ADMIN})
+
+
+def build_lab_model(parent=None) -> QStandardItemModel:
+    """Build a lab combo model: a "Select Lab" placeholder, then active labs.
+
+    Each lab item carries its id as UserRole data. The model is built
+    detached, so installing it gives the combo a single model reset
+    instead of one insert per lab.
+    """
+    try:
+        labs = get_active_labs()
+    except Exception as e:
+        print(f"Error loading labs: {e}")
+        labs = []
+    model = QStandardItemModel(parent)
+    model.appendRow(QStandardItem("Select Lab"))
+    for name, lab_id in labs:
+        item = QStandardItem(name)
+        item.setData(lab_id, Qt.ItemDataRole.UserRole)
+        model.appendRow(item)
+    return model
@@ -0,0 +1,86 @@
+"""
+Header Bar
+Shared dashboard header (welcome message, role badge, user info, logout)
+"""
+
+from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel, QPushButton
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtGui import QFont
+
+from src.i18n import tr
+
+
+class HeaderBar(QWidget):
+    """
+    Common dashboard header.
+    A single instance is shared by all dashboards and reparented into
+    whichever dashboard is currently shown, instead of each dashboard
+    building its own copy of the same widgets.
+    """
+
+    _instance = None
+
+    logout_requested = pyqtSignal()
+
+    @classmethod
+    def shared(cls) -> "HeaderBar":
+        """Get the process-wide header bar, creating it on first use"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.role_badge: QLabel | None = None
+        self.badge_role = None
+        self._init_ui()
+
+    def _init_ui(self):
+        """Create welcome label, user info label and logout button"""
+        self.header_layout = QHBoxLayout()
+        self.header_layout.setContentsMargins(0, 0, 0, 0)
+
+        # Welcome label (will be updated when user loads)
+        self.welcome_label = QLabel(tr("dashboard.welcome"))
+        welcome_font = QFont()
+        welcome_font.setPointSize(16)
+        welcome_font.setBold(True)
+        self.welcome_label.setFont(welcome_font)
+        self.header_layout.addWidget(self.welcome_label)
+
+        # Role badge is inserted after the welcome label by set_role_badge()
+
+        self.header_layout.addStretch()
+
+        # User info (optional)
+        self.user_info_label = QLabel()
+        self.user_info_label.setStyleSheet("color: #666; font-size: 11px;")
+        self.header_layout.addWidget(self.user_info_label)
+
+        # Logout button
+        self.logout_button = QPushButton(tr("dashboard.logout"))
+        self.logout_button.setStyleSheet("""
+            QPushButton {
+                background-color: #dc3545;
+                color: white;
+                padding: 6px 15px;
+                border-radius: 4px;
+                font-size: 12px;
+            }
+            QPushButton:hover {
+                background-color: #c82333;
+            }
+        """)
+        self.logout_button.clicked.connect(self.logout_requested.emit)
+        self.header_layout.addWidget(self.logout_button)
+
+        self.setLayout(self.header_layout)
+
+    def set_role_badge(self, badge: QLabel | None, role):
+        """Replace the role badge (removing the previous one, if any)"""
+        if self.role_badge is not None:
+            self.role_badge.setParent(None)
+        self.role_badge = badge
+        self.badge_role = role
+        if badge is not None:
+            self.header_layout.insertWidget(1, badge)
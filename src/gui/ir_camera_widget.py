@@ -15,23 +15,45 @@ from PyQt6.QtGui import QImage, QPixmap, QPainter, QFont
 import base64
 import json
 import logging
-import os
+import multiprocessing
+from multiprocessing import shared_memory
 from typing import Optional, Tuple
-import numpy as np
+
+from src.instruments.ir_camera_capture import (
+    FrameSlots,
+    capture_process_main,
+    raw_to_celsius,
+)
 
 logger = logging.getLogger(__name__)
 
 
+# Camera paths that worked on the last connect; tried first on the next one
+_loaded_dll_path: Optional[str] = None
+_loaded_config_path: Optional[str] = None
+
+
 class IRCameraThread(QThread):
-    """Background thread for IR camera capture"""
+    """
+    Background thread for IR camera capture.
+    Capture and image processing run in a separate process
+    (src.instruments.ir_camera_capture); this thread starts it and
+    forwards its frames from shared memory to the GUI.
+    """
     
-    frame_ready = pyqtSignal(bytes, float, float, float, list)  # frame, avg, min, max, temps_2d
+    # A new frame is available from take_frame(). Emitted only when the
+    # previous frame has been taken, so a slow GUI never queues a backlog.
+    frame_ready = pyqtSignal()
+    
+    FRAME_INTERVAL = 1 / 30  # ~30 FPS for smoother streaming
     
     def __init__(self, parent=None, dll_path=None, config_path=None):
         super().__init__(parent)
         self.running = False
         self.mutex = QMutex()
-        self.camera_manager = None
+        # Single-slot frame buffer: newest frame wins, stale ones are dropped
+        self._frame_mutex = QMutex()
+        self._latest_frame = None
         self.dll_path = dll_path
         self.config_path = config_path
         
@@ -49,184 +71,126 @@ class IRCameraThread(QThread):
             self.running = False
         self.wait(2000)  # Wait up to 2 seconds
     
+    def _publish_frame(self, frame: tuple):
+        """Store the newest frame, notifying the GUI if the slot was empty"""
+        with QMutexLocker(self._frame_mutex):
+            pending = self._latest_frame is not None
+            self._latest_frame = frame
+        if not pending:
+            self.frame_ready.emit()
+    
+    def take_frame(self) -> Optional[tuple]:
+        """
+        Take the newest frame, if any, as
+        (bgr, width, height, avg, min, max, thermal)
+        where thermal is the raw camera image (see raw_to_celsius)
+        """
+        with QMutexLocker(self._frame_mutex):
+            frame, self._latest_frame = self._latest_frame, None
+        return frame
+    
+    def _candidate_paths(self) -> Tuple[list, list]:
+        """DLL and config paths to try, last working ones first"""
+        # Use provided paths or fallback to defaults
+        dll_paths = [p for p in (_loaded_dll_path, self.dll_path) if p]
+        dll_paths.extend([
+            "C:/IrDirectSDK/sdk/x64/libirimager.dll",
+            "C:/lib/IrDirectSDK/sdk/x64/libirimager.dll",
+            "C:/Program Files/optris/libirimager.dll",
+            "libirimager.dll",  # System PATH
+        ])
+        
+        config_paths = [p for p in (_loaded_config_path, self.config_path) if p]
+        config_paths.extend([
+            'C:/IrDirectSDK/generic.xml',
+            'C:/lib/IrDirectSDK/generic.xml',
+            'C:/Program Files/optris/generic.xml',
+            'generic.xml',
+        ])
+        return dll_paths, config_paths
+    
     def run(self):
-        """Main capture loop"""
+        """Start the capture process and forward its frames"""
+        global _loaded_dll_path, _loaded_config_path
+        
+        # Spawn (not fork) so the child never inherits Qt state
+        ctx = multiprocessing.get_context("spawn")
+        conn, child_conn = ctx.Pipe(duplex=False)
+        frame_lock = ctx.Lock()
+        frame_event = ctx.Event()
+        stop_event = ctx.Event()
+        dll_paths, config_paths = self._candidate_paths()
+        process = ctx.Process(
+            target=capture_process_main,
+            args=(child_conn, dll_paths, config_paths, self.FRAME_INTERVAL,
+                  frame_lock, frame_event, stop_event),
+            daemon=True,
+        )
+        
+        shm = None
+        slots = None
         try:
-            # Try to import pyOptris and cv2
-            try:
-                import pyOptris
-                import cv2
-            except ImportError as e:
-                logger.error(f"Failed to import pyOptris or cv2: {e}")
-                logger.error("Please install: pip install opencv-python")
-                logger.error("For Optris camera support, install pyOptris SDK")
-                self.frame_ready.emit(b"", 0.0, 0.0, 0.0, [])
+            process.start()
+            child_conn.close()
+            
+            # Wait for camera start-up without blocking stop_capture()
+            while self.running and process.is_alive() and not conn.poll(0.1):
+                pass
+            if not self.running:
+                return
+            if not conn.poll():
+                logger.error(
+                    "IR camera process exited during start-up "
+                    f"(exit code {process.exitcode})"
+                )
                 return
             
-            # Initialize camera
-            try:
-                # Use provided paths or fallback to defaults
-                dll_paths = []
-                if self.dll_path:
-                    dll_paths.append(self.dll_path)
-                dll_paths.extend([
-                    "C:/IrDirectSDK/sdk/x64/libirimager.dll",
-                    "C:/lib/IrDirectSDK/sdk/x64/libirimager.dll",
-                    "C:/Program Files/optris/libirimager.dll",
-                    "libirimager.dll",  # System PATH
-                ])
-                
-                dll_loaded = False
-                loaded_dll_path = None
-                for dll_path in dll_paths:
-                    try:
-                        if os.path.exists(dll_path):
-                            pyOptris.load_DLL(dll_path)
-                            dll_loaded = True
-                            loaded_dll_path = dll_path
-                            logger.info(f"Loaded Optris DLL from: {dll_path}")
-                            break
-                    except Exception as e:
-                        logger.debug(f"Failed to load DLL from {dll_path}: {e}")
-                        continue
-                
-                if not dll_loaded:
-                    raise Exception(f"Could not load Optris DLL. Tried: {dll_paths}")
-                
-                # Use provided config path or fallback to defaults
-                config_paths = []
-                if self.config_path:
-                    config_paths.append(self.config_path)
-                config_paths.extend([
-                    'C:/IrDirectSDK/generic.xml',
-                    'C:/lib/IrDirectSDK/generic.xml',
-                    'C:/Program Files/optris/generic.xml',
-                    'generic.xml',
-                ])
-                
-                config_loaded = False
-                loaded_config_path = None
-                for config_path in config_paths:
-                    try:
-                        if os.path.exists(config_path):
-                            pyOptris.usb_init(config_path)
-                            config_loaded = True
-                            loaded_config_path = config_path
-                            logger.info(f"Loaded Optris config from: {config_path}")
-                            break
-                    except Exception as e:
-                        logger.debug(f"Failed to load config from {config_path}: {e}")
-                        continue
-                
-                if not config_loaded:
-                    raise Exception(f"Could not load Optris config. Tried: {config_paths}")
-                
-                pyOptris.set_palette(pyOptris.ColouringPalette.IRON)
-                w, h = pyOptris.get_palette_image_size()
+            message = conn.recv()
+            if message[0] == "error":
+                logger.error(message[1])
+                return
+            _, shm_name, shape, _loaded_dll_path, _loaded_config_path = message
+            logger.info(f"Loaded Optris DLL from: {_loaded_dll_path}")
+            logger.info(f"Loaded Optris config from: {_loaded_config_path}")
+            
+            shm = shared_memory.SharedMemory(name=shm_name)
+            slots = FrameSlots(shm.buf, *shape)
+            
+            while self.running and process.is_alive():
+                if not frame_event.wait(0.1):
+                    continue
+                frame_event.clear()
                 
-                last_min = None
-                last_max = None
+                with frame_lock:
+                    index = int(slots.latest[0])
+                    avg, tmin, tmax = slots.stats[index].tolist()
+                    thermal = slots.thermal[index].copy()
+                    frame = slots.bgr[index].copy()
                 
-                while self.running:
-                    try:
-                        thermal = pyOptris.get_thermal_image(w, h)
-                        temps = ((thermal.astype(np.float32) - 1000.0) / 10.0)
-                        avg = float(np.mean(temps))
-                        tmin = float(np.min(temps))
-                        tmax = float(np.max(temps))
-                        temps_2d = np.round(temps, 1).tolist()
-                        
-                        # Enhanced image processing for maximum clarity
-                        # 1. Adaptive temperature range smoothing (reduced alpha for faster response)
-                        alpha = 0.15  # Faster adaptation for better clarity
-                        if last_min is None:
-                            last_min = tmin
-                            last_max = tmax
-                        else:
-                            last_min = alpha * tmin + (1 - alpha) * last_min
-                            last_max = alpha * tmax + (1 - alpha) * last_max
-                        
-                        # 2. Enhanced dynamic normalization with better contrast
-                        temp_range = last_max - last_min
-                        if temp_range < 1e-6:
-                            temp_range = 1.0  # Avoid division by zero
-                        
-                        # Normalize with slight expansion for better contrast
-                        norm = np.clip(
-                            ((temps - last_min) / temp_range) * 255.0,
-                            0, 255
-                        ).astype(np.uint8)
-                        
-                        # 3. Enhanced CLAHE for better local contrast
-                        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-                        norm = clahe.apply(norm)
-                        
-                        # 4. Apply high-quality colormap (INFERNO for best thermal visualization)
-                        frame = cv2.applyColorMap(norm, cv2.COLORMAP_INFERNO)
-                        
-                        # 5. Advanced denoising (reduced for better detail preservation)
-                        frame = cv2.fastNlMeansDenoisingColored(
-                            frame, None, 
-                            h=8,  # Reduced from 10 for less smoothing
-                            hColor=8,  # Reduced from 10
-                            templateWindowSize=7,
-                            searchWindowSize=21
-                        )
-                        
-                        # 6. High-quality upscaling with Lanczos interpolation
-                        upscale_factor = 2.0  # Increased from 1.5 for better clarity
-                        new_width = int(frame.shape[1] * upscale_factor)
-                        new_height = int(frame.shape[0] * upscale_factor)
-                        frame = cv2.resize(
-                            frame,
-                            (new_width, new_height),
-                            interpolation=cv2.INTER_LANCZOS4  # Best quality interpolation
-                        )
-                        
-                        # 7. Enhanced sharpening for maximum clarity
-                        # Unsharp masking for better edge definition
-                        gaussian = cv2.GaussianBlur(frame, (0, 0), 2.0)
-                        frame = cv2.addWeighted(frame, 1.5, gaussian, -0.5, 0)
-                        
-                        # Additional sharpening kernel
-                        kernel = np.array([
-                            [0, -0.5, 0],
-                            [-0.5, 3, -0.5],
-                            [0, -0.5, 0]
-                        ])
-                        frame = cv2.filter2D(frame, -1, kernel)
-                        
-                        # 8. Gamma correction for better visibility
-                        gamma = 0.9  # Slight brightening
-                        inv_gamma = 1.0 / gamma
-                        table = np.array([((i / 255.0) ** inv_gamma) * 255 
-                                         for i in np.arange(0, 256)]).astype("uint8")
-                        frame = cv2.LUT(frame, table)
-                        
-                        # 9. High-quality JPEG encoding
-                        _, jpeg = cv2.imencode('.jpg', frame, [
-                            int(cv2.IMWRITE_JPEG_QUALITY), 98  # Higher quality
-                        ])
-                        
-                        self.frame_ready.emit(jpeg.tobytes(), avg, tmin, tmax, temps_2d)
-                        self.msleep(33)  # ~30 FPS for smoother streaming
-                        
-                    except Exception as e:
-                        logger.error(f"Error capturing frame: {e}")
-                        self.msleep(100)
-                        
-            except Exception as e:
-                logger.error(f"Failed to initialize IR camera: {e}")
-                self.frame_ready.emit(b"", 0.0, 0.0, 0.0, [])
+                frame_h, frame_w = frame.shape[:2]
+                self._publish_frame(
+                    (frame, frame_w, frame_h, avg, tmin, tmax, thermal)
+                )
+            
+            if conn.poll():
+                message = conn.recv()
+                if message[0] == "error":
+                    logger.error(message[1])
                 
         except Exception as e:
             logger.error(f"IR camera thread error: {e}")
         finally:
-            try:
-                if self.camera_manager:
-                    pyOptris.terminate()
-            except:
-                pass
+            stop_event.set()
+            if process.pid is not None:
+                process.join(1.5)
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+            # Views must be released before the block can be closed
+            slots = None
+            if shm is not None:
+                shm.close()
+            conn.close()
 
 
 class IRCameraWidget(QWidget):
@@ -238,9 +202,12 @@ class IRCameraWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.camera_thread = None
-        self.current_temps = None
+        self.current_thermal = None
         self.hover_temp = None
         self.hover_pos = None
+        # Hover mapping: temperature array and displayed pixmap sizes
+        self._arr_w = self._arr_h = 0
+        self._pix_w = self._pix_h = 0
         
         # Get paths from config
         from src.utils import Config
@@ -329,6 +296,16 @@ class IRCameraWidget(QWidget):
         """)
         self.tooltip_label.hide()
         self.tooltip_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        # Fixed size for the widest reading, so text updates need no relayout
+        self.tooltip_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.tooltip_label.setText("-999.9°C")
+        self.tooltip_label.setFixedSize(self.tooltip_label.sizeHint())
+        
+        # Coalesce rapid mouse moves into at most one tooltip update per 16 ms
+        self._tooltip_timer = QTimer(self)
+        self._tooltip_timer.setSingleShot(True)
+        self._tooltip_timer.setInterval(16)
+        self._tooltip_timer.timeout.connect(self._update_tooltip)
     
     def _toggle_camera(self):
         """Toggle camera connection"""
@@ -363,16 +340,25 @@ class IRCameraWidget(QWidget):
         self.connect_btn.setText("Connect")
         self.image_label.setText("No stream\nClick 'Connect'")
         self.stats_label.setText("Avg: --°C | Min: --°C | Max: --°C")
-        self.current_temps = None
+        self.current_thermal = None
     
-    def _on_frame_ready(self, frame_data: bytes, avg: float, tmin: float, tmax: float, temps_2d: list):
-        """Update display with new frame"""
-        if not frame_data:
+    def _on_frame_ready(self):
+        """Fetch the newest frame from the camera thread and display it"""
+        if not self.camera_thread:
             return
-        
+        latest = self.camera_thread.take_frame()
+        if latest is not None:
+            self._show_frame(*latest)
+    
+    def _show_frame(self, frame, width: int, height: int,
+                    avg: float, tmin: float, tmax: float, thermal):
+        """Update display with new frame"""        
         try:
-            # Convert JPEG bytes to QPixmap
-            image = QImage.fromData(frame_data, "JPEG")
+            # Wrap the BGR buffer without decoding; QPixmap.fromImage copies it
+            image = QImage(
+                frame.data, width, height, frame.strides[0],
+                QImage.Format.Format_BGR888
+            )
             if image.isNull():
                 return
             
@@ -390,61 +376,49 @@ class IRCameraWidget(QWidget):
                 f"Avg: {avg:.1f}°C | Min: {tmin:.1f}°C | Max: {tmax:.1f}°C"
             )
             
-            # Store temperature array for hover tooltip
-            self.current_temps = temps_2d
+            # Store raw thermal image and sizes for hover tooltip
+            # (converted to °C only for the hovered pixel)
+            self.current_thermal = thermal
+            self._arr_h, self._arr_w = thermal.shape[:2]
+            self._pix_w, self._pix_h = scaled_pixmap.width(), scaled_pixmap.height()
             
         except Exception as e:
             logger.error(f"Error displaying frame: {e}")
     
     def _on_mouse_move(self, event):
         """Handle mouse move for temperature tooltip"""
-        if not self.current_temps or not self.image_label.pixmap():
-            return
-        
-        pixmap = self.image_label.pixmap()
-        label_rect = self.image_label.rect()
-        pixmap_rect = pixmap.rect()
-        
-        # Calculate scaled pixmap position within label
-        scaled_width = pixmap_rect.width()
-        scaled_height = pixmap_rect.height()
-        if pixmap_rect.width() > 0 and pixmap_rect.height() > 0:
-            scale_x = scaled_width / pixmap_rect.width()
-            scale_y = scaled_height / pixmap_rect.height()
-        else:
+        self.hover_pos = event.pos()
+        if not self._tooltip_timer.isActive():
+            self._tooltip_timer.start()
+    
+    def _update_tooltip(self):
+        """Show the temperature under the last hover position"""
+        if self.current_thermal is None or not self._pix_w or not self._pix_h:
             return
         
-        # Get mouse position relative to pixmap
-        x = event.pos().x() - (label_rect.width() - scaled_width) / 2
-        y = event.pos().y() - (label_rect.height() - scaled_height) / 2
+        # Mouse position relative to the pixmap (centred in the label)
+        pos = self.hover_pos
+        x = pos.x() - (self.image_label.width() - self._pix_w) // 2
+        y = pos.y() - (self.image_label.height() - self._pix_h) // 2
         
-        if x < 0 or y < 0 or x >= scaled_width or y >= scaled_height:
+        if not (0 <= x < self._pix_w and 0 <= y < self._pix_h):
             self._hide_tooltip()
             return
         
         # Map to temperature array coordinates
-        arr_height = len(self.current_temps)
-        arr_width = len(self.current_temps[0]) if arr_height > 0 else 0
-        
-        if arr_width > 0 and arr_height > 0:
-            arr_x = int(x / scale_x * arr_width / pixmap_rect.width())
-            arr_y = int(y / scale_y * arr_height / pixmap_rect.height())
-            
-            if 0 <= arr_y < arr_height and 0 <= arr_x < arr_width:
-                temp = self.current_temps[arr_y][arr_x]
-                self._show_tooltip(event.pos(), f"{temp:.1f}°C")
-                return
-        
-        self._hide_tooltip()
+        arr_x = x * self._arr_w // self._pix_w
+        arr_y = y * self._arr_h // self._pix_h
+        temp = raw_to_celsius(float(self.current_thermal[arr_y, arr_x]))
+        self._show_tooltip(pos, f"{temp:.1f}°C")
     
     def _on_mouse_leave(self, event):
         """Hide tooltip when mouse leaves"""
+        self._tooltip_timer.stop()
         self._hide_tooltip()
     
     def _show_tooltip(self, pos, text):
         """Show temperature tooltip"""
         self.tooltip_label.setText(text)
-        self.tooltip_label.adjustSize()
         
         # Position tooltip above cursor
         tooltip_x = pos.x() - self.tooltip_label.width() // 2
@@ -3,84 +3,277 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
-    QPushButton,
-    QScrollArea,
     QFrame,
-    QGridLayout,
     QLineEdit,
     QGroupBox,
     QMessageBox,
-    QSizePolicy,
     QComboBox,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
+    QListView,
+    QAbstractItemView,
+    QHeaderView,
     QTabWidget,
+    QStyle,
+    QStyledItemDelegate,
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import (
+    Qt,
+    QEvent,
+    QRect,
+    QRectF,
+    QSize,
+    QThreadPool,
+    QAbstractListModel,
+    QAbstractTableModel,
+    QModelIndex,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QColor, QFont, QPainter, QPalette, QPen
 from datetime import datetime, timedelta
 
 from src.gui.base_dashboard import BaseDashboard
-from src.database import get_db
+from src.database import get_db_session
 from src.models import User, Workbook, UserRole
 from src.services.statistics_service import StatisticsService
 from src.gui.researcher_profile_window import ResearcherProfileWindow
+from src.gui.db_worker import DbWorker
+
+
+# Activity badge text and colour for each researcher card status
+_CARD_STATUS_STYLES = {
+    "active": ("Active recently", "#2e7d32"),
+    "inactive": ("Inactive (>30 days)", "#b71c1c"),
+    "never": ("No login yet", "#757575"),
+}
+
+
+def _researcher_card(
+    researcher: User, stats: dict | None, active_after: datetime
+) -> tuple[int, str, str, str, str]:
+    """Card fields for a researcher.
+
+    Returns (researcher id, name, username line, info line, status), where
+    status is a _CARD_STATUS_STYLES key. Researchers whose last login
+    (naive UTC) is later than ``active_after`` are recently active.
+    """
+    total_workbooks = stats.get("total_workbooks", 0) if stats else 0
+    total_measurements = stats.get("total_measurements", 0) if stats else 0
+    instrument_uses = stats.get("instrument_usage_count", 0) if stats else 0
+
+    info_parts = [
+        f"Workbooks: {total_workbooks}",
+        f"Measurements: {total_measurements}",
+        f"Instrument uses: {instrument_uses}",
+    ]
+    if researcher.last_login:
+        info_parts.append(
+            f"Last active: {researcher.last_login.strftime('%Y-%m-%d %H:%M')}"
+        )
 
+    if researcher.last_login:
+        last_login = researcher.last_login
+        # Normalise to naive UTC before computing delta to avoid
+        # mixing offset-aware and offset-naive datetimes.
+        if last_login.tzinfo is not None:
+            last_login = last_login.astimezone(tz=None).replace(tzinfo=None)
+        status = "active" if last_login > active_after else "inactive"
+    else:
+        status = "never"
 
+    return (
+        researcher.id,
+        researcher.full_name or researcher.username,
+        f"Username: {researcher.username}",
+        " | ".join(info_parts),
+        status,
+    )
 
 
+class ActivityLogModel(QAbstractTableModel):
+    """Table model for the lab activity feed.
 
+    Rows are preformatted (time, researcher name, action, details) string
+    tuples from StatisticsService.get_lab_activity_feed_rows().
+    """
 
+    HEADERS = ["Time", "Researcher", "Action", "Details"]
 
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[tuple[str, str, str, str]] = []
 
+    def setLogs(self, rows: list[tuple[str, str, str, str]]):
+        """Replace the displayed activity rows"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
 
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
 
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
 
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
 
+        return self._rows[index.row()][index.column()]
 
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+        ):
+            return self.HEADERS[section]
+        return None
 
 
+class ResearcherCardModel(QAbstractListModel):
+    """List model for the researcher card grid.
 
+    Rows are _researcher_card() tuples, exposed whole under CardRole.
+    """
 
+    CardRole = Qt.ItemDataRole.UserRole + 1
 
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cards: list[tuple[int, str, str, str, str]] = []
 
+    def setCards(self, cards: list[tuple[int, str, str, str, str]]):
+        """Replace the displayed researcher cards"""
+        self.beginResetModel()
+        self._cards = list(cards)
+        self.endResetModel()
 
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._cards)
 
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == self.CardRole:
+            return self._cards[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._cards[index.row()][1]
+        return None
 
 
+class ResearcherCardDelegate(QStyledItemDelegate):
+    """Paints researcher cards directly instead of creating card widgets.
 
+    Only the cards in view are painted, so the grid costs the same for a
+    lab with hundreds of researchers as for one with ten.
+    """
 
+    view_requested = pyqtSignal(int)  # researcher id
 
+    CARD_SIZE = QSize(260, 190)
+    PADDING = 16
+    SPACING = 6
+    BUTTON_HEIGHT = 28
 
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._fonts: dict[str, QFont] | None = None
+
+    def _card_fonts(self, base: QFont) -> dict[str, QFont]:
+        """Fonts for the card texts, derived once from the view font."""
+        if self._fonts is None:
+            def font(pixel_size: int = 0, point_size: int = 0, weight=None):
+                f = QFont(base)
+                if pixel_size:
+                    f.setPixelSize(pixel_size)
+                if point_size:
+                    f.setPointSize(point_size)
+                if weight is not None:
+                    f.setWeight(weight)
+                return f
+
+            self._fonts = {
+                "name": font(point_size=12, weight=QFont.Weight.Bold),
+                "username": font(pixel_size=11),
+                "info": font(pixel_size=10),
+                "status": font(pixel_size=10, weight=QFont.Weight.DemiBold),
+                "button": font(pixel_size=12, weight=QFont.Weight.DemiBold),
+            }
+        return self._fonts
+
+    def _card_rect(self, item_rect: QRect) -> QRect:
+        return QRect(item_rect.topLeft(), self.CARD_SIZE)
+
+    def _button_rect(self, item_rect: QRect) -> QRect:
+        card = self._card_rect(item_rect)
+        return QRect(
+            card.left() + self.PADDING,
+            card.bottom() - self.PADDING - self.BUTTON_HEIGHT + 1,
+            card.width() - 2 * self.PADDING,
+            self.BUTTON_HEIGHT,
+        )
 
+    def sizeHint(self, option, index):
+        return self.CARD_SIZE
 
+    def paint(self, painter, option, index):
+        _, name, username, info, status = index.data(
+            ResearcherCardModel.CardRole
+        )
+        fonts = self._card_fonts(option.font)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
 
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
+        card = self._card_rect(option.rect)
+        painter.setPen(QPen(QColor("#28a745" if hovered else "#d0d7de"), 1))
+        painter.setBrush(QColor("#ffffff"))
+        painter.drawRoundedRect(QRectF(card).adjusted(0.5, 0.5, -0.5, -0.5), 8, 8)
 
+        button = self._button_rect(option.rect)
+        text_rect = card.adjusted(
+            self.PADDING, self.PADDING, -self.PADDING, -self.PADDING
+        )
+        text_rect.setBottom(button.top() - self.SPACING)
+        # Alignment and text flags are different enums; drawText takes an int
+        wrap = (
+            Qt.AlignmentFlag.AlignLeft.value
+            | Qt.AlignmentFlag.AlignTop.value
+            | Qt.TextFlag.TextWordWrap.value
+        )
 
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+        status_text, status_color = _CARD_STATUS_STYLES[status]
+        for text, font, color in (
+            (name, fonts["name"], option.palette.color(QPalette.ColorRole.Text)),
+            (username, fonts["username"], QColor("#555555")),
+            (info, fonts["info"], QColor("#777777")),
+            (status_text, fonts["status"], QColor(status_color)),
+        ):
+            painter.setFont(font)
+            painter.setPen(color)
+            drawn = painter.boundingRect(text_rect, wrap, text)
+            painter.drawText(text_rect, wrap, text)
+            text_rect.setTop(drawn.bottom() + 1 + self.SPACING)
+            if text_rect.height() <= 0:
+                break
+
+        painter.setPen(QPen(QColor("#28a745"), 1))
+        painter.setBrush(QColor("#e6f4ea" if hovered else "#ffffff"))
+        painter.drawRoundedRect(QRectF(button).adjusted(0.5, 0.5, -0.5, -0.5), 4, 4)
+        painter.setFont(fonts["button"])
+        painter.drawText(button, Qt.AlignmentFlag.AlignCenter, "View Workbooks")
+
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if (
+            event.type() == QEvent.Type.MouseButtonRelease
+            and event.button() == Qt.MouseButton.LeftButton
+            and self._button_rect(option.rect).contains(event.position().toPoint())
+        ):
+            self.view_requested.emit(index.data(ResearcherCardModel.CardRole)[0])
+            return True
+        return super().editorEvent(event, model, option, index)
 
 
 class LabAdminDashboard(BaseDashboard):
@@ -91,11 +284,25 @@ class LabAdminDashboard(BaseDashboard):
         self.statistics_service = StatisticsService()
         self.researchers_all: list[User] = []
         self.researchers_filtered: list[User] = []
-        self.researcher_cards_layout: QGridLayout | None = None
+        self.researcher_view: QListView | None = None
+        self.researcher_model: ResearcherCardModel | None = None
         self.search_input: QLineEdit | None = None
         self.profile_windows: list[ResearcherProfileWindow] = []
-        self.activity_table: QTableWidget | None = None
+        self.activity_table: QTableView | None = None
+        self.activity_model: ActivityLogModel | None = None
         self.activity_range: QComboBox | None = None
+        # Card statistics for researchers_all, loaded with the researchers
+        self._stats_by_researcher: dict[int, dict] = {}
+        # _researcher_card() fields for researchers_all, by researcher id
+        self._cards_by_researcher: dict[int, tuple] = {}
+        # (researcher, search key) pairs; the key is the lowercased full name
+        # and username joined by a newline, which a search can never contain
+        self._search_index: list[tuple[User, str]] = []
+        self._filtered_index: list[tuple[User, str]] = []
+        self._last_query = ""
+        # In-flight background loads; only the latest one's result is applied
+        self._data_worker: DbWorker | None = None
+        self._activity_worker: DbWorker | None = None
         self.init_ui()
     
     def _create_role_badge(self):
@@ -149,15 +356,24 @@ class LabAdminDashboard(BaseDashboard):
         stats_layout.addLayout(range_row)
 
         # Recent activity table
-        self.activity_table = QTableWidget()
-        self.activity_table.setColumnCount(4)
-        self.activity_table.setHorizontalHeaderLabels(
-            ["Time", "Researcher", "Action", "Details"]
+        self.activity_model = ActivityLogModel(self)
+        self.activity_table = QTableView()
+        self.activity_table.setModel(self.activity_model)
+        # Fixed column widths and row heights so populating the table never
+        # measures cell contents; only Details stretches.
+        header = self.activity_table.horizontalHeader()
+        for column, width in ((0, 120), (1, 160), (2, 140)):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Fixed)
+            header.resizeSection(column, width)
+        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
+        self.activity_table.verticalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Fixed
+        )
+        self.activity_table.setEditTriggers(
+            QAbstractItemView.EditTrigger.NoEditTriggers
         )
-        self.activity_table.horizontalHeader().setStretchLastSection(True)
-        self.activity_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
         self.activity_table.setSelectionBehavior(
-            QTableWidget.SelectionBehavior.SelectRows
+            QAbstractItemView.SelectionBehavior.SelectRows
         )
         self.activity_table.setMaximumHeight(180)
         stats_layout.addWidget(self.activity_table)
@@ -193,24 +409,47 @@ class LabAdminDashboard(BaseDashboard):
         search_row.addWidget(self.search_input)
         researchers_layout.addLayout(search_row)
 
-        # Scrollable card grid
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
-
-        cards_container = QWidget()
-        cards_container.setSizePolicy(
-            QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
+        # Card grid; cards are painted by the delegate, only when visible
+        delegate = ResearcherCardDelegate(self)
+        delegate.view_requested.connect(self.view_researcher_work)
+        self.researcher_model = ResearcherCardModel(self)
+        self.researcher_view = QListView()
+        self.researcher_view.setModel(self.researcher_model)
+        self.researcher_view.setItemDelegate(delegate)
+        self.researcher_view.setViewMode(QListView.ViewMode.IconMode)
+        self.researcher_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.researcher_view.setMovement(QListView.Movement.Static)
+        self.researcher_view.setUniformItemSizes(True)
+        card_size = ResearcherCardDelegate.CARD_SIZE
+        self.researcher_view.setGridSize(
+            QSize(card_size.width() + 24, card_size.height() + 24)
+        )
+        self.researcher_view.setSelectionMode(
+            QAbstractItemView.SelectionMode.NoSelection
         )
-        self.researcher_cards_layout = QGridLayout()
-        self.researcher_cards_layout.setSpacing(24)
-        self.researcher_cards_layout.setAlignment(
+        self.researcher_view.setEditTriggers(
+            QAbstractItemView.EditTrigger.NoEditTriggers
+        )
+        self.researcher_view.setFrameShape(QFrame.Shape.NoFrame)
+        # Hover events drive the card border / button highlight
+        self.researcher_view.setMouseTracking(True)
+        self.researcher_view.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover)
+        researchers_layout.addWidget(self.researcher_view)
+
+        # Shown in place of the cards when no researcher matches
+        self._cards_placeholder = QLabel("No researchers found in this lab.")
+        self._cards_placeholder.setStyleSheet("color: #888; font-size: 11px;")
+        self._cards_placeholder.setAlignment(
             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop
         )
-        cards_container.setLayout(self.researcher_cards_layout)
+        self._cards_placeholder.setVisible(False)
+        researchers_layout.addWidget(self._cards_placeholder, 1)
 
-        scroll_area.setWidget(cards_container)
-        researchers_layout.addWidget(scroll_area)
+        # Shown while load_data() is waiting for the worker thread
+        self._loading_label = QLabel("Loading…")
+        self._loading_label.setStyleSheet("color: #888; font-size: 11px;")
+        self._loading_label.setVisible(False)
+        self.content_layout.addWidget(self._loading_label)
 
         # Add tabs to main content
         tabs.addTab(researchers_tab, "Researchers")
@@ -220,253 +459,146 @@ class LabAdminDashboard(BaseDashboard):
         self.content_layout.addWidget(tabs)
     
     def load_data(self):
-        """Load lab admin dashboard data"""
+        """Load lab admin dashboard data on a worker thread"""
         super().load_data()  # Update header
-        self.load_researchers()
-        self.load_statistics()
-        self.load_activity_feed()
-    
-    def load_researchers(self):
-        """Load researchers in the lab"""
         user = self.get_current_user()
         if not user or not user.lab_id:
             return
-        
-        db = next(get_db())
-        try:
-            self.researchers_all = (
+
+        self._loading_label.setVisible(True)
+        # This load fetches the activity feed too; a range change after
+        # this point starts a newer activity worker that takes precedence
+        self._activity_worker = None
+        self._data_worker = DbWorker(
+            self._fetch_dashboard_data, user.lab_id, self._activity_since()
+        )
+        self._data_worker.signals.finished.connect(self._on_data_loaded)
+        self._data_worker.signals.failed.connect(self._on_data_failed)
+        QThreadPool.globalInstance().start(self._data_worker)
+
+    def _fetch_dashboard_data(self, lab_id: int, since: datetime | None) -> dict:
+        """Query researchers, statistics and activity for a lab.
+
+        Runs on a worker thread, so it must not touch any widgets.
+        """
+        with get_db_session() as db:
+            researchers = (
                 db.query(User)
                 .filter(
-                    User.lab_id == user.lab_id,
+                    User.lab_id == lab_id,
                     User.role == UserRole.RESEARCHER,
                     User.is_active == True,  # noqa: E712
                 )
                 .order_by(User.full_name.asc())
                 .all()
             )
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load researchers: {str(e)}")
-            self.researchers_all = []
-        finally:
-            db.close()
+            researcher_stats = (
+                self.statistics_service.get_researcher_statistics_bulk(
+                    db, [r.id for r in researchers]
+                )
+                if researchers
+                else {}
+            )
+            return {
+                "researchers": researchers,
+                "researcher_stats": researcher_stats,
+                "lab_totals": self.statistics_service.get_lab_totals(db, lab_id),
+                "activity": self.statistics_service.get_lab_activity_feed_rows(
+                    db, lab_id, since=since, limit=50
+                ),
+            }
+
+    def _on_data_loaded(self, data: dict):
+        """Populate the dashboard from a finished _fetch_dashboard_data()"""
+        if self.sender() is not self._data_worker.signals:
+            return  # superseded by a newer load_data()
+        self._loading_label.setVisible(False)
+
+        self.researchers_all = data["researchers"]
+        self._stats_by_researcher = data["researcher_stats"]
+        self._search_index = [
+            (r, f"{r.full_name or ''}\n{r.username or ''}".lower())
+            for r in self.researchers_all
+        ]
+        self._last_query = ""
+        self._refresh_cards()
+
+        self._show_lab_totals(data["lab_totals"])
+        if self._activity_worker is None:
+            self.activity_model.setLogs(data["activity"])
 
+    def _on_data_failed(self, error: Exception):
+        """Report a failed _fetch_dashboard_data()"""
+        if self.sender() is not self._data_worker.signals:
+            return
+        self._loading_label.setVisible(False)
+        QMessageBox.critical(
+            self, "Error", f"Failed to load dashboard data: {str(error)}"
+        )
+
+    def _refresh_cards(self):
+        """Recompute card fields for all researchers and re-apply the search."""
+        # "Active recently" means a login within the last 30 full days
+        active_after = datetime.utcnow() - timedelta(days=31)
+        self._cards_by_researcher = {
+            r.id: _researcher_card(
+                r, self._stats_by_researcher.get(r.id), active_after
+            )
+            for r in self.researchers_all
+        }
         self._apply_filter()
 
     def _apply_filter(self):
-        """Filter researchers based on search text and rebuild cards."""
+        """Filter researchers based on search text and update the cards."""
         text = ""
         if self.search_input is not None:
             text = self.search_input.text().strip().lower()
 
         if not text:
-            self.researchers_filtered = list(self.researchers_all)
+            self._filtered_index = self._search_index
         else:
-            filtered: list[User] = []
-            for r in self.researchers_all:
-                name = (r.full_name or "").lower()
-                username = (r.username or "").lower()
-                if text in name or text in username:
-                    filtered.append(r)
-            self.researchers_filtered = filtered
-
-        self._build_researcher_cards()
-
-    def _build_researcher_cards(self):
-        """Create cards for each researcher in the lab."""
-        if self.researcher_cards_layout is None:
-            return
-
-        # Clear existing items
-        while self.researcher_cards_layout.count():
-            item = self.researcher_cards_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.setParent(None)
-
-        if not self.researchers_filtered:
-            placeholder = QLabel("No researchers found in this lab.")
-            placeholder.setStyleSheet("color: #888; font-size: 11px;")
-            self.researcher_cards_layout.addWidget(placeholder, 0, 0)
-            return
-
-        # Fetch per-researcher statistics
-        db = next(get_db())
-        stats_by_researcher: dict[int, dict] = {}
-        try:
-            for r in self.researchers_filtered:
-                stats_by_researcher[r.id] = self.statistics_service.get_researcher_statistics(
-                    db, r.id
-                )
-        finally:
-            db.close()
-
-        # Layout cards
-        available_width = max(self.width() - 80, 320)
-        card_width = 260
-        spacing = self.researcher_cards_layout.horizontalSpacing() or 24
-        cards_per_row = max(1, int(available_width / (card_width + spacing)))
-
-        row = 0
-        col = 0
-        for researcher in self.researchers_filtered:
-            card = self._create_researcher_card(
-                researcher, stats_by_researcher.get(researcher.id)
-            )
-            self.researcher_cards_layout.addWidget(card, row, col)
-            col += 1
-            if col >= cards_per_row:
-                col = 0
-                row += 1
-
-    def _create_researcher_card(self, researcher: User, stats: dict | None) -> QFrame:
-        """Create a card widget for a single researcher."""
-        card = QFrame()
-        card.setFrameShape(QFrame.Shape.StyledPanel)
-        card.setObjectName("researcherCard")
-        card.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        card.setStyleSheet(
-            """
-            QFrame#researcherCard {
-                border: 1px solid #d0d7de;
-                border-radius: 8px;
-                background-color: #ffffff;
-            }
-            QFrame#researcherCard:hover {
-                border: 1px solid #28a745;
-            }
-            """
-        )
-
-        layout = QVBoxLayout(card)
-        layout.setContentsMargins(16, 16, 16, 16)
-        layout.setSpacing(6)
-
-        name_label = QLabel(researcher.full_name or researcher.username)
-        name_font = name_label.font()
-        name_font.setPointSize(12)
-        name_font.setBold(True)
-        name_label.setFont(name_font)
-        name_label.setWordWrap(True)
-        layout.addWidget(name_label)
-
-        username_label = QLabel(f"Username: {researcher.username}")
-        username_label.setStyleSheet("color: #555; font-size: 11px;")
-        layout.addWidget(username_label)
-
-        total_workbooks = stats.get("total_workbooks", 0) if stats else 0
-        total_measurements = stats.get("total_measurements", 0) if stats else 0
-        instrument_uses = stats.get("instrument_usage_count", 0) if stats else 0
-
-        info_parts = [
-            f"Workbooks: {total_workbooks}",
-            f"Measurements: {total_measurements}",
-            f"Instrument uses: {instrument_uses}",
-        ]
-        if researcher.last_login:
-            info_parts.append(
-                f"Last active: {researcher.last_login.strftime('%Y-%m-%d %H:%M')}"
-            )
-        info_label = QLabel(" | ".join(info_parts))
-        info_label.setStyleSheet("color: #777; font-size: 10px;")
-        info_label.setWordWrap(True)
-        layout.addWidget(info_label)
-
-        # Activity "health" badge
-        status_label = QLabel()
-        if researcher.last_login:
-            last_login = researcher.last_login
-            # Normalise to naive UTC before computing delta to avoid
-            # mixing offset-aware and offset-naive datetimes.
-            if last_login.tzinfo is not None:
-                last_login = last_login.astimezone(tz=None).replace(tzinfo=None)
-            delta = datetime.utcnow() - last_login
-            if delta.days <= 30:
-                status_label.setText("Active recently")
-                status_label.setStyleSheet(
-                    "color: #2e7d32; font-size: 10px; font-weight: 600;"
-                )
+            # Typing more characters can only narrow the previous matches,
+            # so search those instead of the full list.
+            if self._last_query and text.startswith(self._last_query):
+                candidates = self._filtered_index
             else:
-                status_label.setText("Inactive (>30 days)")
-                status_label.setStyleSheet(
-                    "color: #b71c1c; font-size: 10px; font-weight: 600;"
-                )
-        else:
-            status_label.setText("No login yet")
-            status_label.setStyleSheet(
-                "color: #757575; font-size: 10px; font-weight: 600;"
-            )
-        layout.addWidget(status_label)
-
-        layout.addStretch()
-
-        view_button = QPushButton("View Workbooks")
-        view_button.setMinimumHeight(28)
-        view_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #ffffff;
-                color: #28a745;
-                border: 1px solid #28a745;
-                border-radius: 4px;
-                font-size: 12px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: #e6f4ea;
-            }
-            QPushButton:pressed {
-                background-color: #c8e6c9;
-            }
-            """
-        )
-        view_button.clicked.connect(
-            lambda _=False, r_id=researcher.id: self.view_researcher_work(r_id)
-        )
-        layout.addWidget(view_button)
-
-        card.setFixedWidth(260)
-        card.setMinimumHeight(160)
-        card.setMaximumHeight(190)
-
-        return card
-
-    def load_statistics(self):
-        """Load and display aggregate lab statistics in the header section."""
-        user = self.get_current_user()
-        if not user or not user.lab_id:
+                candidates = self._search_index
+            self._filtered_index = [
+                entry for entry in candidates if text in entry[1]
+            ]
+        self._last_query = text
+        self.researchers_filtered = [entry[0] for entry in self._filtered_index]
+
+        if self.researcher_model is None:
             return
-
-        db = next(get_db())
-        try:
-            lab_stats = self.statistics_service.get_lab_statistics(db, user.lab_id)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load statistics: {str(e)}")
-            return
-        finally:
-            db.close()
-
-        researcher_stats = lab_stats.get("researcher_stats", {})
-        total_workbooks = sum(
-            rs.get("total_workbooks", 0) for rs in researcher_stats.values()
-        )
-        total_measurements = sum(
-            rs.get("total_measurements", 0) for rs in researcher_stats.values()
+        self.researcher_model.setCards(
+            [self._cards_by_researcher[r.id] for r in self.researchers_filtered]
         )
-        instrument_uses = sum(
-            rs.get("instrument_usage_count", 0) for rs in researcher_stats.values()
-        )
-
-        total_researchers = lab_stats.get("total_researchers", 0)
+        has_cards = bool(self.researchers_filtered)
+        self.researcher_view.setVisible(has_cards)
+        self._cards_placeholder.setVisible(not has_cards)
 
+    def _show_lab_totals(self, totals: dict):
+        """Display aggregate lab statistics in the header section."""
         self.stats_label.setText(
-            f"Researchers: {total_researchers} | "
-            f"Workbooks: {total_workbooks} | "
-            f"Measurements: {total_measurements} | "
-            f"Instrument uses: {instrument_uses}"
+            f"Researchers: {totals['total_researchers']} | "
+            f"Workbooks: {totals['total_workbooks']} | "
+            f"Measurements: {totals['total_measurements']} | "
+            f"Instrument uses: {totals['instrument_usage_count']}"
         )
 
+    def _activity_since(self) -> datetime | None:
+        """Start of the date range selected for the activity feed."""
+        selection = self.activity_range.currentText()
+        now = datetime.utcnow()
+        if "7 days" in selection:
+            return now - timedelta(days=7)
+        if "30 days" in selection:
+            return now - timedelta(days=30)
+        return None  # All time
+
     def load_activity_feed(self):
-        """Load recent activity logs into the activity table."""
+        """Reload the activity table for the selected date range."""
         if self.activity_table is None or self.activity_range is None:
             return
 
@@ -474,57 +606,42 @@ class LabAdminDashboard(BaseDashboard):
         if not user or not user.lab_id:
             return
 
-        # Determine date range
-        selection = self.activity_range.currentText()
-        since: datetime | None = None
-        now = datetime.utcnow()
-        if "7 days" in selection:
-            since = now - timedelta(days=7)
-        elif "30 days" in selection:
-            since = now - timedelta(days=30)
-        else:
-            since = None  # All time
-
-        db = next(get_db())
-        try:
-            logs = self.statistics_service.get_lab_activity_logs(
-                db, user.lab_id, since=since, limit=50
+        self._activity_worker = DbWorker(
+            self._fetch_activity_rows, user.lab_id, self._activity_since()
+        )
+        self._activity_worker.signals.finished.connect(self._on_activity_loaded)
+        self._activity_worker.signals.failed.connect(self._on_activity_failed)
+        QThreadPool.globalInstance().start(self._activity_worker)
+
+    def _fetch_activity_rows(
+        self, lab_id: int, since: datetime | None
+    ) -> list[tuple[str, str, str, str]]:
+        """Query activity feed rows (runs on a worker thread)."""
+        with get_db_session() as db:
+            return self.statistics_service.get_lab_activity_feed_rows(
+                db, lab_id, since=since, limit=50
             )
 
-            self.activity_table.setRowCount(len(logs))
-            for row, log in enumerate(logs):
-                time_str = (
-                    log.created_at.strftime("%Y-%m-%d %H:%M")
-                    if log.created_at
-                    else ""
-                )
-                researcher_name = (
-                    (log.user.full_name or log.user.username)
-                    if getattr(log, "user", None)
-                    else "System"
-                )
-                action_text = log.action_type.value.replace("_", " ").title()
-                details = log.description or ""
-
-                self.activity_table.setItem(row, 0, QTableWidgetItem(time_str))
-                self.activity_table.setItem(row, 1, QTableWidgetItem(researcher_name))
-                self.activity_table.setItem(row, 2, QTableWidgetItem(action_text))
-                self.activity_table.setItem(row, 3, QTableWidgetItem(details))
-        except Exception as e:
-            QMessageBox.critical(
-                self, "Error", f"Failed to load recent activity: {str(e)}"
-            )
-        finally:
-            db.close()
+    def _on_activity_loaded(self, rows: list[tuple[str, str, str, str]]):
+        if (
+            self._activity_worker is None
+            or self.sender() is not self._activity_worker.signals
+        ):
+            return  # superseded by a newer range selection or load_data()
+        self.activity_model.setLogs(rows)
+
+    def _on_activity_failed(self, error: Exception):
+        if (
+            self._activity_worker is None
+            or self.sender() is not self._activity_worker.signals
+        ):
+            return
+        QMessageBox.critical(
+            self, "Error", f"Failed to load recent activity: {str(error)}"
+        )
 
     def view_researcher_work(self, researcher_id: int):
         """Open a read-only researcher profile with their workbooks."""
         window = ResearcherProfileWindow(researcher_id, None)
         window.showMaximized()
         self.profile_windows.append(window)
-
-    def resizeEvent(self, event):
-        """Rebuild card layout on resize to keep grid responsive."""
-        super().resizeEvent(event)
-        self._build_researcher_cards()
-
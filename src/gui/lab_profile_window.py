@@ -6,17 +6,141 @@ from PyQt6.QtWidgets import (
     QLabel,
     QPushButton,
     QTabWidget,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
+    QAbstractItemView,
+    QHeaderView,
     QMessageBox,
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThreadPool, QAbstractTableModel, QModelIndex, pyqtSignal
+from PyQt6.QtGui import QFont
+from sqlalchemy import and_, func, select
+from functools import partial
+from bisect import bisect_right
 
-from datetime import datetime
-
-from src.database import get_db
+from src.database import get_db_session
 from src.models import Lab, User, UserRole
 from src.gui.dialogs.create_user_dialog import CreateUserDialog
+from src.gui.db_worker import DbWorker
+
+
+# Bold heading fonts by point size; built on first use (needs a QApplication)
+_BOLD_FONTS: dict[int, QFont] = {}
+
+
+def _bold_font(point_size: int) -> QFont:
+    """Shared bold font of the given point size"""
+    font = _BOLD_FONTS.get(point_size)
+    if font is None:
+        font = QFont()
+        font.setPointSize(point_size)
+        font.setBold(True)
+        _BOLD_FONTS[point_size] = font
+    return font
+
+
+def _last_login_column(dialect_name: str):
+    """User.last_login formatted as "YYYY-MM-DD HH:MM" (or "Never") in SQL."""
+    if dialect_name == "postgresql":
+        formatted = func.to_char(User.last_login, "YYYY-MM-DD HH24:MI")
+    else:  # sqlite
+        formatted = func.strftime("%Y-%m-%d %H:%M", User.last_login)
+    return func.coalesce(formatted, "Never").label("last_login")
+
+
+class UserTableModel(QAbstractTableModel):
+    """Table model for lab member lists.
+
+    Rows are (name, username, email, last login) display strings, loaded a
+    page at a time: when the view scrolls to the end, ``fetch_page(offset,
+    limit)`` is run on a worker thread and its rows are appended.
+    """
+
+    HEADERS = ["Name", "Username", "Email", "Last Login"]
+    PAGE_SIZE = 100
+
+    page_failed = pyqtSignal(object)  # exception raised by a page fetch
+
+    def __init__(self, fetch_page, parent=None):
+        super().__init__(parent)
+        self._fetch_page = fetch_page
+        self._rows: list[tuple[str, str, str, str]] = []
+        self._has_more = False
+        # In-flight page fetch; None when idle
+        self._worker: DbWorker | None = None
+
+    def setRows(self, rows: list[tuple[str, str, str, str]]):
+        """Replace the displayed users with the first page of rows"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        # A short page means there is nothing left to fetch
+        self._has_more = len(self._rows) >= self.PAGE_SIZE
+        self._worker = None  # a page fetched for the old rows is ignored
+        self.endResetModel()
+
+    def insertSorted(self, row: tuple[str, str, str, str]) -> bool:
+        """Insert a new user's row at its name position.
+
+        Only done once every page is loaded. Returns False, leaving the
+        model unchanged, while pages remain: the database orders names by
+        its own collation, so a row placed by Python's ordering could shift
+        the OFFSET of the next page and duplicate or skip a user.
+        """
+        if self._has_more or self._worker is not None:
+            return False
+        position = bisect_right(self._rows, row[0], key=lambda r: r[0])
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._rows.insert(position, row)
+        self.endInsertRows()
+        return True
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._has_more and self._worker is None
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        self._worker = DbWorker(self._fetch_page, len(self._rows), self.PAGE_SIZE)
+        self._worker.signals.finished.connect(self._on_page_loaded)
+        self._worker.signals.failed.connect(self._on_page_failed)
+        QThreadPool.globalInstance().start(self._worker)
+
+    def _on_page_loaded(self, rows: list[tuple[str, str, str, str]]):
+        if self._worker is None or self.sender() is not self._worker.signals:
+            return
+        self._worker = None
+        self._has_more = len(rows) >= self.PAGE_SIZE
+        if rows:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+            self._rows.extend(rows)
+            self.endInsertRows()
+
+    def _on_page_failed(self, error: Exception):
+        if self._worker is None or self.sender() is not self._worker.signals:
+            return
+        self._worker = None
+        # _has_more is kept, so the next scroll to the end retries
+        self.page_failed.emit(error)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+
+        return self._rows[index.row()][index.column()]
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+        ):
+            return self.HEADERS[section]
+        return None
 
 
 class LabProfileWindow(QMainWindow):
@@ -26,13 +150,15 @@ class LabProfileWindow(QMainWindow):
         super().__init__(parent)
         self.lab_id = lab_id
         self.lab: Lab | None = None
-        self.admins_table: QTableWidget | None = None
-        self.researchers_table: QTableWidget | None = None
+        self.admins_table: QTableView | None = None
+        self.researchers_table: QTableView | None = None
+        # Active member counts by role, shown in the header
+        self._member_counts: dict[UserRole, int] = {}
+        # In-flight background load; only the latest one's result is applied
+        self._worker: DbWorker | None = None
 
         self._init_ui()
-        self._load_lab()
-        self._load_admins()
-        self._load_researchers()
+        self._load_data()
 
     def _init_ui(self):
         self.setWindowTitle("Lab Profile - TE Measurements")
@@ -46,10 +172,7 @@ class LabProfileWindow(QMainWindow):
         # Header
         header = QHBoxLayout()
         self.name_label = QLabel("Lab")
-        name_font = self.name_label.font()
-        name_font.setPointSize(14)
-        name_font.setBold(True)
-        self.name_label.setFont(name_font)
+        self.name_label.setFont(_bold_font(14))
         header.addWidget(self.name_label)
 
         self.meta_label = QLabel("")
@@ -76,10 +199,7 @@ class LabProfileWindow(QMainWindow):
 
         admins_header = QHBoxLayout()
         admins_title = QLabel("Lab Admins")
-        title_font = admins_title.font()
-        title_font.setPointSize(12)
-        title_font.setBold(True)
-        admins_title.setFont(title_font)
+        admins_title.setFont(_bold_font(12))
         admins_header.addWidget(admins_title)
         admins_header.addStretch()
         add_admin_btn = QPushButton("Add Lab Admin")
@@ -88,13 +208,7 @@ class LabProfileWindow(QMainWindow):
         admins_header.addWidget(add_admin_btn)
         admins_layout.addLayout(admins_header)
 
-        self.admins_table = QTableWidget()
-        self.admins_table.setColumnCount(4)
-        self.admins_table.setHorizontalHeaderLabels(
-            ["Name", "Username", "Email", "Last Login"]
-        )
-        self.admins_table.horizontalHeader().setStretchLastSection(True)
-        self.admins_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.admins_table = self._create_user_table(UserRole.LAB_ADMIN)
         admins_layout.addWidget(self.admins_table)
 
         # Researchers tab
@@ -105,10 +219,7 @@ class LabProfileWindow(QMainWindow):
 
         researchers_header = QHBoxLayout()
         researchers_title = QLabel("Researchers")
-        r_title_font = researchers_title.font()
-        r_title_font.setPointSize(12)
-        r_title_font.setBold(True)
-        researchers_title.setFont(r_title_font)
+        researchers_title.setFont(_bold_font(12))
         researchers_header.addWidget(researchers_title)
         researchers_header.addStretch()
         add_researcher_btn = QPushButton("Add Researcher")
@@ -117,13 +228,7 @@ class LabProfileWindow(QMainWindow):
         researchers_header.addWidget(add_researcher_btn)
         researchers_layout.addLayout(researchers_header)
 
-        self.researchers_table = QTableWidget()
-        self.researchers_table.setColumnCount(4)
-        self.researchers_table.setHorizontalHeaderLabels(
-            ["Name", "Username", "Email", "Last Login"]
-        )
-        self.researchers_table.horizontalHeader().setStretchLastSection(True)
-        self.researchers_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.researchers_table = self._create_user_table(UserRole.RESEARCHER)
         researchers_layout.addWidget(self.researchers_table)
 
         tabs.addTab(admins_tab, "Admins")
@@ -133,115 +238,196 @@ class LabProfileWindow(QMainWindow):
 
         self.setCentralWidget(central)
 
-    def _load_lab(self):
-        db = next(get_db())
-        try:
-            self.lab = db.query(Lab).filter(Lab.id == self.lab_id).first()
-            if not self.lab:
-                QMessageBox.warning(self, "Not Found", "Lab not found.")
-                self.close()
-                return
-
-            created_str = (
-                self.lab.created_at.strftime("%Y-%m-%d")
-                if self.lab.created_at
-                else ""
-            )
-            self.name_label.setText(self.lab.name)
-            meta_parts = []
-            if self.lab.location:
-                meta_parts.append(self.lab.location)
-            if created_str:
-                meta_parts.append(f"Created: {created_str}")
-            meta_parts.append("Active" if self.lab.is_active else "Inactive")
-            self.meta_label.setText(" | ".join(meta_parts))
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load lab: {str(e)}")
-        finally:
-            db.close()
-
-    def _load_admins(self):
-        if self.admins_table is None:
-            return
-
-        db = next(get_db())
-        try:
-            admins = (
-                db.query(User)
-                .filter(
-                    User.lab_id == self.lab_id,
-                    User.role == UserRole.LAB_ADMIN,
-                    User.is_active == True,  # noqa: E712
+    def _create_user_table(self, role: UserRole) -> QTableView:
+        """Create a read-only table view of the lab's users with a role."""
+        table = QTableView()
+        model = UserTableModel(partial(self._fetch_user_page, self.lab_id, role), table)
+        model.page_failed.connect(self._on_page_failed)
+        table.setModel(model)
+        # Fixed default widths so populating never measures cell contents
+        header = table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setDefaultSectionSize(180)
+        header.setStretchLastSection(True)
+        table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        return table
+
+    def _load_data(self):
+        """Load the lab and its members on a worker thread."""
+        self._worker = DbWorker(self._fetch_lab_data, self.lab_id)
+        self._worker.signals.finished.connect(self._on_data_loaded)
+        self._worker.signals.failed.connect(self._on_data_failed)
+        QThreadPool.globalInstance().start(self._worker)
+
+    def _fetch_lab_data(self, lab_id: int) -> dict | None:
+        """Query the lab and the first page of its admins and researchers.
+
+        Runs on a worker thread, so it must not touch any widgets. Returns
+        None if the lab does not exist.
+        """
+        with get_db_session() as db:
+            # The lab and its active member counts by role, in one statement
+            row = db.execute(
+                select(
+                    Lab,
+                    func.count(User.id)
+                    .filter(User.role == UserRole.LAB_ADMIN)
+                    .label("admin_count"),
+                    func.count(User.id)
+                    .filter(User.role == UserRole.RESEARCHER)
+                    .label("researcher_count"),
                 )
-                .order_by(User.full_name.asc())
-                .all()
+                .outerjoin(
+                    User,
+                    and_(
+                        User.lab_id == Lab.id,
+                        User.is_active == True,  # noqa: E712
+                    ),
+                )
+                .where(Lab.id == lab_id)
+                .group_by(Lab.id)
+            ).one_or_none()
+            if row is None:
+                return None
+
+            page_size = UserTableModel.PAGE_SIZE
+            return {
+                "lab": row.Lab,
+                "admin_count": row.admin_count,
+                "researcher_count": row.researcher_count,
+                "admins": self._query_user_page(
+                    db, lab_id, UserRole.LAB_ADMIN, 0, page_size
+                ),
+                "researchers": self._query_user_page(
+                    db, lab_id, UserRole.RESEARCHER, 0, page_size
+                ),
+            }
+
+    def _fetch_user_page(
+        self, lab_id: int, role: UserRole, offset: int, limit: int
+    ) -> list[tuple]:
+        """Query one page of a user table (runs on a worker thread)."""
+        with get_db_session() as db:
+            return self._query_user_page(db, lab_id, role, offset, limit)
+
+    @staticmethod
+    def _query_user_page(
+        db, lab_id: int, role: UserRole, offset: int, limit: int
+    ) -> list[tuple]:
+        """Active users of a lab with a role, as display rows in name order.
+
+        Only the displayed columns are selected, as plain row tuples, with
+        last login already formatted by the database.
+        """
+        return (
+            db.query(
+                User.full_name,
+                User.username,
+                User.email,
+                _last_login_column(db.get_bind().dialect.name),
+            )
+            .filter(
+                User.lab_id == lab_id,
+                User.role == role,
+                User.is_active == True,  # noqa: E712
             )
+            # id breaks ties between equal names so pages never overlap
+            .order_by(User.full_name.asc(), User.id.asc())
+            .offset(offset)
+            .limit(limit)
+            .all()
+        )
 
-            self.admins_table.setRowCount(len(admins))
-            for row, admin in enumerate(admins):
-                last_login = (
-                    admin.last_login.strftime("%Y-%m-%d %H:%M")
-                    if admin.last_login
-                    else "Never"
-                )
-                self.admins_table.setItem(row, 0, QTableWidgetItem(admin.full_name))
-                self.admins_table.setItem(row, 1, QTableWidgetItem(admin.username))
-                self.admins_table.setItem(row, 2, QTableWidgetItem(admin.email))
-                self.admins_table.setItem(row, 3, QTableWidgetItem(last_login))
-
-            self.admins_table.resizeColumnsToContents()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load admins: {str(e)}")
-        finally:
-            db.close()
-
-    def _load_researchers(self):
-        if self.researchers_table is None:
+    def _on_data_loaded(self, data: dict | None):
+        """Populate the window from a finished _fetch_lab_data()"""
+        if self.sender() is not self._worker.signals:
+            return  # superseded by a newer _load_data()
+        if data is None:
+            QMessageBox.warning(self, "Not Found", "Lab not found.")
+            self.close()
             return
 
-        db = next(get_db())
-        try:
-            researchers = (
-                db.query(User)
-                .filter(
-                    User.lab_id == self.lab_id,
-                    User.role == UserRole.RESEARCHER,
-                    User.is_active == True,  # noqa: E712
-                )
-                .order_by(User.full_name.asc())
-                .all()
-            )
+        self.lab = data["lab"]
+        self.name_label.setText(self.lab.name)
+        self._member_counts = {
+            UserRole.LAB_ADMIN: data["admin_count"],
+            UserRole.RESEARCHER: data["researcher_count"],
+        }
+        self._update_meta_label()
+
+        self._populate_table(self.admins_table, data["admins"])
+        self._populate_table(self.researchers_table, data["researchers"])
+
+    def _update_meta_label(self):
+        """Show the lab's location, creation date, status and member counts."""
+        created_str = (
+            self.lab.created_at.strftime("%Y-%m-%d") if self.lab.created_at else ""
+        )
+        meta_parts = []
+        if self.lab.location:
+            meta_parts.append(self.lab.location)
+        if created_str:
+            meta_parts.append(f"Created: {created_str}")
+        meta_parts.append("Active" if self.lab.is_active else "Inactive")
+        meta_parts.append(
+            f"Admins: {self._member_counts.get(UserRole.LAB_ADMIN, 0)} | "
+            f"Researchers: {self._member_counts.get(UserRole.RESEARCHER, 0)}"
+        )
+        self.meta_label.setText(" | ".join(meta_parts))
 
-            self.researchers_table.setRowCount(len(researchers))
-            for row, r in enumerate(researchers):
-                last_login = (
-                    r.last_login.strftime("%Y-%m-%d %H:%M")
-                    if r.last_login
-                    else "Never"
-                )
-                self.researchers_table.setItem(row, 0, QTableWidgetItem(r.full_name))
-                self.researchers_table.setItem(row, 1, QTableWidgetItem(r.username))
-                self.researchers_table.setItem(row, 2, QTableWidgetItem(r.email))
-                self.researchers_table.setItem(row, 3, QTableWidgetItem(last_login))
-
-            self.researchers_table.resizeColumnsToContents()
-        except Exception as e:
-            QMessageBox.critical(
-                self, "Error", f"Failed to load researchers: {str(e)}"
-            )
-        finally:
-            db.close()
+    def _on_data_failed(self, error: Exception):
+        """Report a failed _fetch_lab_data()"""
+        if self.sender() is not self._worker.signals:
+            return
+        QMessageBox.critical(self, "Error", f"Failed to load lab: {str(error)}")
+
+    def _on_page_failed(self, error: Exception):
+        """Report a user table page that failed to load"""
+        QMessageBox.warning(
+            self,
+            "Error",
+            f"Failed to load more users: {str(error)}\n\n"
+            "Scroll to the end of the list to try again.",
+        )
+
+    def _populate_table(self, table: QTableView, rows: list[tuple]):
+        """Fill a user table from (full_name, username, email, last_login) rows."""
+        table.model().setRows(rows)
 
     def _add_lab_admin(self):
         """Open user creation dialog preconfigured as lab admin for this lab."""
         dialog = CreateUserDialog(self, preset_role=UserRole.LAB_ADMIN, preset_lab_id=self.lab_id)
         if dialog.exec() == dialog.DialogCode.Accepted:
-            self._load_admins()
+            self._show_created_user(dialog.created_user)
 
     def _add_researcher(self):
         """Open user creation dialog preconfigured as researcher for this lab."""
         dialog = CreateUserDialog(self, preset_role=UserRole.RESEARCHER, preset_lab_id=self.lab_id)
         if dialog.exec() == dialog.DialogCode.Accepted:
-            self._load_researchers()
+            self._show_created_user(dialog.created_user)
+
+    def _show_created_user(self, user: User | None):
+        """Add a user created from this window without reloading the lab."""
+        tables = {
+            UserRole.LAB_ADMIN: self.admins_table,
+            UserRole.RESEARCHER: self.researchers_table,
+        }
+        if (
+            user is None
+            or self.lab is None
+            or user.lab_id != self.lab_id
+            or user.role not in tables
+        ):
+            return
+
+        # A new user has never logged in
+        if not tables[user.role].model().insertSorted(
+            (user.full_name, user.username, user.email, "Never")
+        ):
+            # Pages remain; re-query so paging stays in database order
+            self._load_data()
+            return
+        self._member_counts[user.role] = self._member_counts.get(user.role, 0) + 1
+        self._update_meta_label()
 
 
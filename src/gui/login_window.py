@@ -14,19 +14,80 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont, QPixmap
 
-from src.auth import AuthManager
+from src.auth import get_auth_manager
+
+
+_LOGO_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "assets", "logo.png"
+)
+
+_CARD_QSS = """
+    QFrame#loginCard {
+        background-color: #ffffff;
+        border-radius: 10px;
+        border: 1px solid #d0d7de;
+    }
+"""
+
+_INPUT_QSS = """
+    QLineEdit {
+        border: 1px solid #d0d7de;
+        border-radius: 4px;
+        padding: 6px 8px;
+        font-size: 13px;
+    }
+    QLineEdit:focus {
+        border: 1px solid #0078d4;
+    }
+"""
+
+_BUTTON_QSS = """
+    QPushButton {
+        background-color: #0078d4;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        font-size: 14px;
+        font-weight: 600;
+        padding: 6px 12px;
+    }
+    QPushButton:hover {
+        background-color: #005a9e;
+    }
+    QPushButton:pressed {
+        background-color: #004578;
+    }
+    QPushButton:disabled {
+        background-color: #9fc5e8;
+    }
+"""
 
 
 class LoginWindow(QWidget):
     """Login window for user authentication"""
     
     login_successful = pyqtSignal(object)  # Emits User object
+
+    # Logo scaled for the card header; loaded on first use (needs a QApplication)
+    _LOGO_PIXMAP: QPixmap | None = None
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.auth_manager = AuthManager()
+        self.auth_manager = get_auth_manager()
         self.init_ui()
     
+    @classmethod
+    def _logo_pixmap(cls) -> QPixmap:
+        """Scaled logo, read from disk once (a null pixmap if missing)"""
+        if cls._LOGO_PIXMAP is None:
+            pixmap = QPixmap(_LOGO_PATH) if os.path.exists(_LOGO_PATH) else QPixmap()
+            if not pixmap.isNull():
+                pixmap = pixmap.scaledToHeight(
+                    48, Qt.TransformationMode.SmoothTransformation
+                )
+            cls._LOGO_PIXMAP = pixmap
+        return cls._LOGO_PIXMAP
+
     def init_ui(self):
         """Initialize UI components with university logo and modern card layout"""
         # Root layout to center the login card
@@ -44,15 +105,9 @@ class LoginWindow(QWidget):
         # Card frame
         card = QFrame()
         card.setObjectName("loginCard")
-        card.setStyleSheet(
-            """
-            QFrame#loginCard {
-                background-color: #ffffff;
-                border-radius: 10px;
-                border: 1px solid #d0d7de;
-            }
-            """
-        )
+        # Card and input styles are parsed once here; both line edits
+        # pick up the QLineEdit rules from the card
+        card.setStyleSheet(_CARD_QSS + _INPUT_QSS)
         card_layout = QVBoxLayout(card)
         card_layout.setContentsMargins(40, 32, 40, 32)
         card_layout.setSpacing(20)
@@ -60,15 +115,9 @@ class LoginWindow(QWidget):
         # Header with logo centered above title
         logo_label = QLabel()
         logo_label.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignVCenter)
-        logo_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "assets", "logo.png"
-        )
-        if os.path.exists(logo_path):
-            pixmap = QPixmap(logo_path)
-            if not pixmap.isNull():
-                logo_label.setPixmap(
-                    pixmap.scaledToHeight(48, Qt.TransformationMode.SmoothTransformation)
-                )
+        logo = self._logo_pixmap()
+        if not logo.isNull():
+            logo_label.setPixmap(logo)
         card_layout.addWidget(logo_label)
 
         title = QLabel("TE Measurements")
@@ -93,19 +142,6 @@ class LoginWindow(QWidget):
         self.username_input = QLineEdit()
         self.username_input.setPlaceholderText("Username")
         self.username_input.setMinimumHeight(36)
-        self.username_input.setStyleSheet(
-            """
-            QLineEdit {
-                border: 1px solid #d0d7de;
-                border-radius: 4px;
-                padding: 6px 8px;
-                font-size: 13px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #0078d4;
-            }
-            """
-        )
         form_layout.addRow("Username:", self.username_input)
 
         # Password field
@@ -113,19 +149,6 @@ class LoginWindow(QWidget):
         self.password_input.setPlaceholderText("Password")
         self.password_input.setEchoMode(QLineEdit.EchoMode.Password)
         self.password_input.setMinimumHeight(36)
-        self.password_input.setStyleSheet(
-            """
-            QLineEdit {
-                border: 1px solid #d0d7de;
-                border-radius: 4px;
-                padding: 6px 8px;
-                font-size: 13px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #0078d4;
-            }
-            """
-        )
         form_layout.addRow("Password:", self.password_input)
 
         card_layout.addLayout(form_layout)
@@ -133,28 +156,7 @@ class LoginWindow(QWidget):
         # Login button
         login_button = QPushButton("Login")
         login_button.setMinimumHeight(38)
-        login_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-size: 14px;
-                font-weight: 600;
-                padding: 6px 12px;
-            }
-            QPushButton:hover {
-                background-color: #005a9e;
-            }
-            QPushButton:pressed {
-                background-color: #004578;
-            }
-            QPushButton:disabled {
-                background-color: #9fc5e8;
-            }
-            """
-        )
+        login_button.setStyleSheet(_BUTTON_QSS)
         login_button.clicked.connect(self.handle_login)
         card_layout.addWidget(login_button)
 
@@ -201,5 +203,9 @@ class LoginWindow(QWidget):
         """Clear input fields"""
         self.username_input.clear()
         self.password_input.clear()
+
+    def showEvent(self, event):
+        """Focus the username field whenever the login view is shown"""
+        super().showEvent(event)
         self.username_input.setFocus()
 
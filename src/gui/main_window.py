@@ -5,18 +5,27 @@ from src.gui.login_window import LoginWindow
 from src.gui.researcher_dashboard import ResearcherDashboard
 from src.gui.lab_admin_dashboard import LabAdminDashboard
 from src.gui.super_admin_dashboard import SuperAdminDashboard
+from src.gui.base_dashboard import BaseDashboard
 from src.models import UserRole
-from src.auth import SessionManager, AuthManager
+from src.auth import get_session_manager, get_auth_manager
 from src.i18n import set_session_manager
 
 
+# Dashboard class shown for each user role
+_DASHBOARD_CLASSES = {
+    UserRole.RESEARCHER: ResearcherDashboard,
+    UserRole.LAB_ADMIN: LabAdminDashboard,
+    UserRole.SUPER_ADMIN: SuperAdminDashboard,
+}
+
+
 class MainWindow(QMainWindow):
     """Main application window with shared login and role-based dashboards"""
 
     def __init__(self):
         super().__init__()
-        self.session_manager = SessionManager()
-        self.auth_manager = AuthManager()
+        self.session_manager = get_session_manager()
+        self.auth_manager = get_auth_manager()
         
         # Initialize translation system with session manager
         set_session_manager(self.session_manager)
@@ -28,25 +37,30 @@ class MainWindow(QMainWindow):
         self.stacked_widget = QStackedWidget()
         self.setCentralWidget(self.stacked_widget)
 
-        # Views
+        # Views; dashboards are only built the first time their role logs in
         self.login_window = LoginWindow(self)
-        self.researcher_dashboard = ResearcherDashboard(self)
-        self.lab_admin_dashboard = LabAdminDashboard(self)
-        self.super_admin_dashboard = SuperAdminDashboard(self)
-
-        # Add to stacked widget
         self.stacked_widget.addWidget(self.login_window)
-        self.stacked_widget.addWidget(self.researcher_dashboard)
-        self.stacked_widget.addWidget(self.lab_admin_dashboard)
-        self.stacked_widget.addWidget(self.super_admin_dashboard)
+        self._dashboards: dict[UserRole, BaseDashboard] = {}
 
         # Connect signals
         self.login_window.login_successful.connect(self.on_login_successful)
 
-        # Connect logout signals from all dashboards
-        self.researcher_dashboard.logout_requested.connect(self.on_logout)
-        self.lab_admin_dashboard.logout_requested.connect(self.on_logout)
-        self.super_admin_dashboard.logout_requested.connect(self.on_logout)
+        # Logout / exit confirmations, built once and reused
+        yes_no = QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        self._confirm_logout = QMessageBox(
+            QMessageBox.Icon.Question,
+            "Logout",
+            "Are you sure you want to logout?",
+            yes_no,
+            self,
+        )
+        self._confirm_exit = QMessageBox(
+            QMessageBox.Icon.Question,
+            "Exit",
+            "Are you sure you want to exit?",
+            yes_no,
+            self,
+        )
 
         # Show login initially for all roles
         self.show_login()
@@ -63,43 +77,41 @@ class MainWindow(QMainWindow):
     
     def show_dashboard_for_user(self, user):
         """Show appropriate dashboard based on user role"""
-        if user.role == UserRole.RESEARCHER:
-            self.researcher_dashboard.load_data()
-            self.stacked_widget.setCurrentWidget(self.researcher_dashboard)
-        elif user.role == UserRole.LAB_ADMIN:
-            self.lab_admin_dashboard.load_data()
-            self.stacked_widget.setCurrentWidget(self.lab_admin_dashboard)
-        elif user.role == UserRole.SUPER_ADMIN:
-            self.super_admin_dashboard.load_data()
-            self.stacked_widget.setCurrentWidget(self.super_admin_dashboard)
-        else:
+        if user.role not in _DASHBOARD_CLASSES:
             QMessageBox.warning(self, "Error", "Unknown user role")
             self.show_login()
+            return
+
+        dashboard = self._dashboards.get(user.role)
+        if dashboard is None:
+            dashboard = self._build_dashboard(user.role)
+        dashboard.load_data()
+        self.stacked_widget.setCurrentWidget(dashboard)
+
+    def _build_dashboard(self, role: UserRole) -> BaseDashboard:
+        """Create, register and cache the dashboard for a role"""
+        dashboard = _DASHBOARD_CLASSES[role](self)
+        self.stacked_widget.addWidget(dashboard)
+        dashboard.logout_requested.connect(self.on_logout)
+        self._dashboards[role] = dashboard
+        return dashboard
     
+    @staticmethod
+    def _confirm(box: QMessageBox) -> bool:
+        """Show a reusable Yes/No box; True if Yes was clicked"""
+        box.exec()
+        return box.standardButton(box.clickedButton()) == QMessageBox.StandardButton.Yes
+
     def on_logout(self):
         """Handle logout"""
-        reply = QMessageBox.question(
-            self,
-            "Logout",
-            "Are you sure you want to logout?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-        )
-        
-        if reply == QMessageBox.StandardButton.Yes:
+        if self._confirm(self._confirm_logout):
             self.session_manager.logout()
             self.show_login()
     
     def closeEvent(self, event):
         """Handle window close event"""
         if self.session_manager.is_authenticated():
-            reply = QMessageBox.question(
-                self,
-                "Exit",
-                "Are you sure you want to exit?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-            )
-            
-            if reply == QMessageBox.StandardButton.Yes:
+            if self._confirm(self._confirm_exit):
                 self.session_manager.logout()
                 event.accept()
             else:
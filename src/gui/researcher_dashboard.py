@@ -13,7 +13,7 @@ from PyQt6.QtWidgets import (
     QToolButton,
     QMenu,
 )
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QTimer
 from PyQt6.QtGui import QAction
 
 from sqlalchemy import func
@@ -26,6 +26,92 @@ from src.services.workbook_service import WorkbookService
 from src.gui.workbook_window import WorkbookWindow
 from src.i18n import tr
 
+# Card stylesheets, shared by every card instead of rebuilt per card
+_CARD_QSS = """
+    QFrame#workbookCard {
+        border: 1px solid #d0d7de;
+        border-radius: 8px;
+        background-color: #ffffff;
+    }
+    QFrame#workbookCard:hover {
+        border: 1px solid #0078d4;
+    }
+"""
+
+_NEW_CARD_QSS = """
+    QFrame#newWorkbookCard {
+        border: 1px dashed #9fc5e8;
+        border-radius: 8px;
+        background-color: #ffffff;
+    }
+    QFrame#newWorkbookCard:hover {
+        border: 1px solid #0078d4;
+        background-color: #f0f6ff;
+    }
+"""
+
+_TITLE_EDIT_QSS = """
+    QLineEdit {
+        border: none;
+        background: transparent;
+        font-size: 12px;
+        font-weight: bold;
+    }
+    QLineEdit:focus {
+        border-bottom: 1px solid #0078d4;
+        background: #f0f6ff;
+    }
+"""
+
+_OPTIONS_QSS = """
+    QToolButton {
+        border: none;
+        font-weight: bold;
+        color: #888;
+        padding: 0 2px;
+    }
+    QToolButton::menu-indicator {
+        image: none;
+    }
+    QToolButton:hover {
+        color: #000;
+    }
+"""
+
+_OPEN_BTN_QSS = """
+    QPushButton {
+        background-color: #ffffff;
+        color: #0078d4;
+        border: 1px solid #0078d4;
+        border-radius: 4px;
+        font-size: 12px;
+        font-weight: 600;
+    }
+    QPushButton:hover {
+        background-color: #e5f1fb;
+    }
+    QPushButton:pressed {
+        background-color: #cde4f7;
+    }
+"""
+
+_CREATE_BTN_QSS = """
+    QPushButton {
+        background-color: #0078d4;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        font-weight: 600;
+    }
+    QPushButton:hover {
+        background-color: #005a9e;
+    }
+    QPushButton:pressed {
+        background-color: #004578;
+    }
+"""
+
+
 class ResearcherDashboard(BaseDashboard):
     """Dashboard for researchers"""
     
@@ -34,10 +120,29 @@ class ResearcherDashboard(BaseDashboard):
         self.workbook_service = WorkbookService()
         self.workbooks_all: list[Workbook] = []
         self.workbooks_filtered: list[Workbook] = []
+        # (workbook, lowercased title) pairs for the search filter
+        self._title_lc: list[tuple[Workbook, str]] = []
+        # Cards currently placed in the grid (New Workbook card first)
         self.card_widgets: list[QFrame] = []
+        # Workbook cards by workbook id, reused across rebuilds
+        self._card_cache: dict[int, QFrame] = {}
+        self._new_card: QFrame | None = None
         self.cards_layout: QGridLayout | None = None
         self.search_input: QLineEdit | None = None
         self.open_workbook_windows: list[WorkbookWindow] = []
+        self._cache_translations()
+
+        # Coalesce bursts of keystrokes and resize events into one rebuild;
+        # start() on a running single-shot timer restarts it
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self._build_cards)
+
         self.init_ui()
     
     def _create_role_badge(self):
@@ -54,6 +159,10 @@ class ResearcherDashboard(BaseDashboard):
             }
         """)
         return badge
+
+    def _retranslate_role_badge(self, badge):
+        """Refresh researcher badge text for the current language"""
+        badge.setText(tr("dashboard.researcher"))
     
     def init_ui(self):
         """Initialize UI components specific to researcher (card grid of workbooks)"""
@@ -69,7 +178,7 @@ class ResearcherDashboard(BaseDashboard):
         self.search_label_ref = QLabel(tr("researcher.search_workbooks"))
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText(tr("researcher.search_placeholder"))
-        self.search_input.textChanged.connect(self._apply_filter)
+        self.search_input.textChanged.connect(self._filter_timer.start)
 
         toolbar.addWidget(self.search_label_ref)
         toolbar.addWidget(self.search_input)
@@ -120,10 +229,20 @@ class ResearcherDashboard(BaseDashboard):
             self.refresh_button_ref.setText(tr("researcher.refresh"))
         if hasattr(self, 'search_input') and self.search_input:
             self.search_input.setPlaceholderText(tr("researcher.search_placeholder"))
-        
+
+        self._cache_translations()
+
         # Rebuild cards to refresh translated text in cards
         self._build_cards()
     
+    def _cache_translations(self):
+        """Look up the texts shared by all workbook cards once per language."""
+        self._tr_sample = tr("researcher.sample")
+        self._tr_created = tr("researcher.created")
+        self._tr_last_meas = tr("researcher.last_measurement")
+        self._tr_open = tr("researcher.open_workbook")
+        self._tr_delete = tr("researcher.delete_workbook")
+
     def load_data(self):
         """Load researcher's workbooks and rebuild card grid"""
         super().load_data()  # Update header
@@ -156,6 +275,8 @@ class ResearcherDashboard(BaseDashboard):
         finally:
             db.close()
 
+        self._title_lc = [(wb, (wb.title or "").lower()) for wb in self.workbooks_all]
+
         print(f"[ResearcherDashboard] Loaded {len(self.workbooks_all)} workbook(s)")
         self._apply_filter()  # will rebuild cards
 
@@ -168,12 +289,7 @@ class ResearcherDashboard(BaseDashboard):
         if not text:
             self.workbooks_filtered = list(self.workbooks_all)
         else:
-            filtered: list[Workbook] = []
-            for wb in self.workbooks_all:
-                name_match = text in (wb.title or "").lower()
-                if name_match:
-                    filtered.append(wb)
-            self.workbooks_filtered = filtered
+            self.workbooks_filtered = [wb for wb, title in self._title_lc if text in title]
 
         self._build_cards()
 
@@ -189,14 +305,14 @@ class ResearcherDashboard(BaseDashboard):
             print("[ResearcherDashboard] _build_cards exiting because cards_layout is None")
             return
 
-        # Clear existing items
-        while self.cards_layout.count():
-            item = self.cards_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.setParent(None)
+        # Detach the current cards from the grid; they are re-placed below
+        for card in self.card_widgets:
+            self.cards_layout.removeWidget(card)
 
-        self.card_widgets = []
+        # Drop cards of workbooks that no longer exist
+        live_ids = {wb.id for wb in self.workbooks_all}
+        for wb_id in [wb_id for wb_id in self._card_cache if wb_id not in live_ids]:
+            self._card_cache.pop(wb_id).deleteLater()
 
         print(
             f"[ResearcherDashboard] Building cards for "
@@ -204,15 +320,28 @@ class ResearcherDashboard(BaseDashboard):
         )
 
         # First card: New Workbook
-        new_card = self._create_new_workbook_card()
-        self.card_widgets.append(new_card)
+        if self._new_card is None:
+            self._new_card = self._create_new_workbook_card()
+        else:
+            self._update_new_workbook_card(self._new_card)
+        self.card_widgets = [self._new_card]
 
-        # Workbook cards
+        # Workbook cards; only workbooks seen for the first time get a new card
         for wb in self.workbooks_filtered:
-            card = self._create_workbook_card(wb)
+            card = self._card_cache.get(wb.id)
+            if card is None:
+                card = self._create_workbook_card(wb)
+                self._card_cache[wb.id] = card
+            else:
+                self._update_workbook_card(card, wb)
             self.card_widgets.append(card)
 
-        # Layout cards in grid; number per row depends on available width
+        # Hide cached cards that the filter excludes
+        shown = set(self.card_widgets)
+        for card in self._card_cache.values():
+            if card not in shown:
+                card.setVisible(False)
+
         # Layout cards in grid; number per row depends on available width
         # Use the dashboard width as an approximation of available space.
         available_width = max(self.width() - 80, 320)
@@ -223,6 +352,7 @@ class ResearcherDashboard(BaseDashboard):
         col = 0
         for card in self.card_widgets:
             self.cards_layout.addWidget(card, row, col)
+            card.setVisible(True)
             col += 1
             if col >= cards_per_row:
                 col = 0
@@ -234,58 +364,31 @@ class ResearcherDashboard(BaseDashboard):
         card.setFrameShape(QFrame.Shape.StyledPanel)
         card.setObjectName("newWorkbookCard")
         card.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        card.setStyleSheet(
-            """
-            QFrame#newWorkbookCard {
-                border: 1px dashed #9fc5e8;
-                border-radius: 8px;
-                background-color: #ffffff;
-            }
-            QFrame#newWorkbookCard:hover {
-                border: 1px solid #0078d4;
-                background-color: #f0f6ff;
-            }
-            """
-        )
+        card.setStyleSheet(_NEW_CARD_QSS)
 
         layout = QVBoxLayout(card)
         layout.setContentsMargins(16, 16, 16, 16)
         layout.setSpacing(8)
 
-        title = QLabel(tr("researcher.new_workbook"))
-        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_font = title.font()
+        card.title_label = QLabel()
+        card.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        title_font = card.title_label.font()
         title_font.setPointSize(12)
         title_font.setBold(True)
-        title.setFont(title_font)
-        layout.addWidget(title)
+        card.title_label.setFont(title_font)
+        layout.addWidget(card.title_label)
 
-        subtitle = QLabel(tr("researcher.new_workbook_subtitle"))
-        subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        subtitle.setStyleSheet("color: #666; font-size: 11px;")
-        layout.addWidget(subtitle)
+        card.subtitle_label = QLabel()
+        card.subtitle_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        card.subtitle_label.setStyleSheet("color: #666; font-size: 11px;")
+        layout.addWidget(card.subtitle_label)
 
         layout.addStretch()
 
-        button = QPushButton(tr("researcher.create_workbook"))
+        button = QPushButton()
+        card.create_button = button
         button.setMinimumHeight(32)
-        button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: #005a9e;
-            }
-            QPushButton:pressed {
-                background-color: #004578;
-            }
-            """
-        )
+        button.setStyleSheet(_CREATE_BTN_QSS)
         button.clicked.connect(self.create_workbook)
         layout.addWidget(button)
 
@@ -293,49 +396,38 @@ class ResearcherDashboard(BaseDashboard):
         card.setFixedWidth(260)
         card.setMinimumHeight(160)
         card.setMaximumHeight(190)
+
+        self._update_new_workbook_card(card)
         return card
 
+    def _update_new_workbook_card(self, card: QFrame):
+        """Refresh the translated texts of the New Workbook card."""
+        card.title_label.setText(tr("researcher.new_workbook"))
+        card.subtitle_label.setText(tr("researcher.new_workbook_subtitle"))
+        card.create_button.setText(tr("researcher.create_workbook"))
+
     def _create_workbook_card(self, workbook: Workbook) -> QFrame:
-        """Create a card widget for a single workbook."""
+        """Create a card widget for a single workbook.
+
+        The child widgets are kept as attributes so _update_workbook_card
+        can refresh the card in place when the workbook is reloaded.
+        """
         card = QFrame()
         card.setFrameShape(QFrame.Shape.StyledPanel)
         card.setObjectName("workbookCard")
         card.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        card.setStyleSheet(
-            """
-            QFrame#workbookCard {
-                border: 1px solid #d0d7de;
-                border-radius: 8px;
-                background-color: #ffffff;
-            }
-            QFrame#workbookCard:hover {
-                border: 1px solid #0078d4;
-            }
-            """
-        )
+        card.setStyleSheet(_CARD_QSS)
 
         layout = QVBoxLayout(card)
         layout.setContentsMargins(16, 16, 16, 16)
         layout.setSpacing(6)
 
         # Header row: editable title + overflow menu (three vertical dots)
-        title_edit = QLineEdit(workbook.title or "Untitled Workbook")
+        title_edit = QLineEdit()
+        card.title_edit = title_edit
         title_edit.setAlignment(Qt.AlignmentFlag.AlignCenter)
         title_edit.setFrame(False)
-        title_edit.setStyleSheet(
-            """
-            QLineEdit {
-                border: none;
-                background: transparent;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QLineEdit:focus {
-                border-bottom: 1px solid #0078d4;
-                background: #f0f6ff;
-            }
-            """
-        )
+        title_edit.setStyleSheet(_TITLE_EDIT_QSS)
         title_edit.setToolTip("Click to rename this workbook; press Enter to save")
         title_edit.editingFinished.connect(
             lambda wb_id=workbook.id, editor=title_edit: self.inline_rename_workbook(
@@ -353,30 +445,17 @@ class ResearcherDashboard(BaseDashboard):
         options_button.setText("⋮")
         options_button.setToolTip("More options")
         options_button.setPopupMode(QToolButton.ToolButtonPopupMode.InstantPopup)
-        options_button.setStyleSheet(
-            """
-            QToolButton {
-                border: none;
-                font-weight: bold;
-                color: #888;
-                padding: 0 2px;
-            }
-            QToolButton::menu-indicator {
-                image: none;
-            }
-            QToolButton:hover {
-                color: #000;
-            }
-            """
-        )
+        options_button.setStyleSheet(_OPTIONS_QSS)
 
         menu = QMenu(options_button)
-        delete_action = QAction(tr("researcher.delete_workbook"), options_button)
+        delete_action = QAction(options_button)
+        # Read the saved title when triggered; it changes when the card is reused
         delete_action.triggered.connect(
-            lambda _=False, wb_id=workbook.id, wb_title=workbook.title: self.confirm_delete_workbook(
-                wb_id, wb_title or "Untitled Workbook"
+            lambda _=False, wb_id=workbook.id, c=card: self.confirm_delete_workbook(
+                wb_id, c.workbook_title
             )
         )
+        card.delete_action = delete_action
         menu.addAction(delete_action)
         options_button.setMenu(menu)
 
@@ -385,55 +464,56 @@ class ResearcherDashboard(BaseDashboard):
         )
         layout.addLayout(header_row)
 
-        if workbook.sample_name:
-            sample_label = QLabel(f"{tr('researcher.sample')} {workbook.sample_name}")
-            sample_label.setStyleSheet("color: #555; font-size: 11px;")
-            layout.addWidget(sample_label)
+        card.sample_label = QLabel()
+        card.sample_label.setStyleSheet("color: #555; font-size: 11px;")
+        layout.addWidget(card.sample_label)
 
-        dates = []
-        if workbook.created_at:
-            dates.append(f"{tr('researcher.created')} {workbook.created_at.strftime('%Y-%m-%d %H:%M')}")
-        if workbook.last_measurement_at:
-            dates.append(
-                f"{tr('researcher.last_measurement')} {workbook.last_measurement_at.strftime('%Y-%m-%d %H:%M')}"
-            )
-
-        if dates:
-            date_label = QLabel(" | ".join(dates))
-            date_label.setStyleSheet("color: #777; font-size: 10px;")
-            date_label.setWordWrap(True)
-            layout.addWidget(date_label)
+        card.date_label = QLabel()
+        card.date_label.setStyleSheet("color: #777; font-size: 10px;")
+        card.date_label.setWordWrap(True)
+        layout.addWidget(card.date_label)
 
         layout.addStretch()
 
-        open_button = QPushButton(tr("researcher.open_workbook"))
+        open_button = QPushButton()
+        card.open_button = open_button
         open_button.setMinimumHeight(28)
-        open_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #ffffff;
-                color: #0078d4;
-                border: 1px solid #0078d4;
-                border-radius: 4px;
-                font-size: 12px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: #e5f1fb;
-            }
-            QPushButton:pressed {
-                background-color: #cde4f7;
-            }
-            """
-        )
+        open_button.setStyleSheet(_OPEN_BTN_QSS)
         open_button.clicked.connect(lambda _=False, wb_id=workbook.id: self.open_workbook_by_id(wb_id))
         layout.addWidget(open_button)
 
         card.setFixedWidth(260)
         card.setMinimumHeight(160)
         card.setMaximumHeight(190)
+
+        self._update_workbook_card(card, workbook)
         return card
 
+    def _update_workbook_card(self, card: QFrame, workbook: Workbook):
+        """Fill a workbook card with the workbook's current details."""
+        title = workbook.title or "Untitled Workbook"
+        card.workbook_title = title
+        # Leave a title that is being edited alone
+        if card.title_edit.text() != title and not card.title_edit.hasFocus():
+            card.title_edit.setText(title)
+
+        card.sample_label.setVisible(bool(workbook.sample_name))
+        if workbook.sample_name:
+            card.sample_label.setText(f"{self._tr_sample} {workbook.sample_name}")
+
+        dates = []
+        if workbook.created_at:
+            dates.append(f"{self._tr_created} {workbook.created_at.strftime('%Y-%m-%d %H:%M')}")
+        if workbook.last_measurement_at:
+            dates.append(
+                f"{self._tr_last_meas} {workbook.last_measurement_at.strftime('%Y-%m-%d %H:%M')}"
+            )
+        card.date_label.setVisible(bool(dates))
+        card.date_label.setText(" | ".join(dates))
+
+        card.delete_action.setText(self._tr_delete)
+        card.open_button.setText(self._tr_open)
+
     def create_workbook(self):
         """Create a new workbook with a default untitled name and refresh."""
         user = self.get_current_user()
@@ -469,6 +549,7 @@ class ResearcherDashboard(BaseDashboard):
         new_title = editor.text().strip()
         if not new_title:
             # Revert on empty; reload titles from DB
+            self._revert_title(workbook_id, editor)
             self.load_data()
             return
 
@@ -484,12 +565,23 @@ class ResearcherDashboard(BaseDashboard):
             db.commit()
         except Exception as e:
             db.rollback()
+            self._revert_title(workbook_id, editor)
             QMessageBox.critical(self, tr("common.error"), f"Failed to rename workbook: {str(e)}")
         finally:
             db.close()
 
         self.load_data()
 
+    def _revert_title(self, workbook_id: int, editor: QLineEdit):
+        """Put the saved title back into a card's title editor.
+
+        The editor keeps focus after Enter, so the reload in load_data
+        leaves its text alone (see _update_workbook_card).
+        """
+        card = self._card_cache.get(workbook_id)
+        if card is not None:
+            editor.setText(card.workbook_title)
+
     def confirm_delete_workbook(self, workbook_id: int, title: str):
         """Ask for confirmation and soft-delete the workbook via service."""
         user = self.get_current_user()
@@ -528,5 +620,5 @@ class ResearcherDashboard(BaseDashboard):
     def resizeEvent(self, event):
         """Rebuild card layout on resize to keep grid responsive."""
         super().resizeEvent(event)
-        self._build_cards()
+        self._resize_timer.start()
 
@@ -38,7 +38,7 @@ from src.instruments.keithley_connection import KeithleyConnection
 from src.database import get_db
 from src.models import MeasurementType
 from src.services.measurement_service import MeasurementService
-from src.auth import SessionManager
+from src.auth import get_session_manager
 from src.utils import Config
 
 
@@ -174,7 +174,7 @@ class ResistivityTab(QWidget):
         self.workbook_id = workbook_id
         self.measurement_service = MeasurementService()
         self.config = Config()
-        self.session_manager = SessionManager()
+        self.session_manager = get_session_manager()
 
         # Live data polling timer
         self._timer = QTimer(self)
@@ -34,7 +34,7 @@ from src.gui.ir_camera_widget import IRCameraWidget
 from src.database import get_db
 from src.models import MeasurementType
 from src.services.measurement_service import MeasurementService
-from src.auth import SessionManager
+from src.auth import get_session_manager
 from src.utils import Config
 
 
@@ -176,7 +176,7 @@ class SeebeckTab(QWidget):
         self.workbook_id = workbook_id
         self.measurement_service = MeasurementService()
         self.config = Config()
-        self.session_manager = SessionManager()
+        self.session_manager = get_session_manager()
 
         # Live data polling timer
         self._timer = QTimer(self)
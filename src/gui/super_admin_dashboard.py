@@ -242,7 +242,7 @@ class SuperAdminDashboard(BaseDashboard):
         """Load labs table"""
         db = next(get_db())
         try:
-            labs = db.query(Lab).filter(Lab.is_active == True).all()
+            labs = db.query(Lab).filter(Lab.is_active.is_(True)).all()
             
             self.labs_table.setRowCount(len(labs))
             
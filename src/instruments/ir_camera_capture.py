@@ -0,0 +1,430 @@
+"""
+IR Camera Capture Process for Optris 450 Series
+
+Runs the camera and the per-frame image pipeline in a separate process, so
+frame processing never competes with the GUI for the GIL. Processed frames
+are handed over through a two-slot shared memory buffer (see FrameSlots);
+the GUI side lives in src.gui.ir_camera_widget.IRCameraThread.
+
+Kept free of Qt/GUI imports so the spawned process starts quickly.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from multiprocessing import shared_memory
+from typing import List, Tuple
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+
+def raw_to_celsius(raw):
+    """Convert Optris raw thermal values (scalar or array) to °C"""
+    return (raw - 1000.0) / 10.0
+
+
+def _combined_sharpen_kernel(size: int = 5) -> np.ndarray:
+    """
+    Single kernel equivalent to unsharp masking (1.5*I - 0.5*Gaussian(sigma=2))
+    followed by the 3x3 sharpening kernel, cropped to size x size.
+    The exact kernel is 15x15, which is slower to apply than the separate
+    passes; the weight outside the crop is folded back into the centre so
+    flat regions keep their brightness.
+    """
+    sigma = 2.0
+    radius = 6  # Matches OpenCV's 13-tap kernel for sigma=2 on 8-bit images
+    x = np.arange(-radius, radius + 1)
+    g = np.exp(-(x ** 2) / (2 * sigma ** 2))
+    g /= g.sum()
+    unsharp = -0.5 * np.outer(g, g)
+    unsharp[radius, radius] += 1.5
+
+    sharpen = np.array([
+        [0, -0.5, 0],
+        [-0.5, 3, -0.5],
+        [0, -0.5, 0]
+    ])
+
+    # Full 2D convolution of the two kernels
+    n = unsharp.shape[0] + sharpen.shape[0] - 1
+    full = np.zeros((n, n))
+    for (i, j), weight in np.ndenumerate(sharpen):
+        full[i:i + unsharp.shape[0], j:j + unsharp.shape[1]] += weight * unsharp
+
+    c, r = n // 2, size // 2
+    kernel = full[c - r:c + r + 1, c - r:c + r + 1].copy()
+    kernel[r, r] += full.sum() - kernel.sum()
+    return kernel.astype(np.float32)
+
+
+class IRFrameProcessor:
+    """Turns raw thermal images into enhanced BGR display frames"""
+
+    UPSCALE_FACTOR = 2.0  # Increased from 1.5 for better clarity
+
+    def __init__(self, cv2):
+        # Per-frame processing objects are built once, not per frame
+        self._clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+        self._sharpen_kernel = _combined_sharpen_kernel()
+
+        # Gamma correction table (gamma 0.9 = slight brightening)
+        gamma = 0.9
+        self._gamma_table = (
+            ((np.arange(256) / 255.0) ** (1.0 / gamma)) * 255
+        ).astype(np.uint8)
+
+        # Per-frame output buffers, allocated on the first frame
+        self._buffer_shape = None
+
+        # Optional GPU path for the upscale/sharpen/gamma stages
+        if self._init_cuda(cv2):
+            self._enhance_gpu = self._enhance_cuda
+        elif self._init_opencl(cv2):
+            self._enhance_gpu = self._enhance_opencl
+        else:
+            self._enhance_gpu = None
+
+        # Smoothed display range, and the normalization LUT indexed by the
+        # raw uint16 thermal value (rebuilt only when the range moves)
+        self._last_min = None
+        self._last_max = None
+        self._raw_celsius = raw_to_celsius(np.arange(65536, dtype=np.float32))
+        self._norm_lut = None
+
+    @classmethod
+    def upscaled_size(cls, height: int, width: int) -> Tuple[int, int]:
+        """Size of the display frame produced for a height x width image"""
+        return int(height * cls.UPSCALE_FACTOR), int(width * cls.UPSCALE_FACTOR)
+
+    def _ensure_buffers(self, height: int, width: int):
+        """(Re)allocate the reusable per-frame image buffers for a frame size"""
+        if self._buffer_shape == (height, width):
+            return
+        up_h, up_w = self.upscaled_size(height, width)
+        self._norm_buf = np.empty((height, width), np.uint8)
+        self._clahe_buf = np.empty((height, width), np.uint8)
+        self._denoise_buf = np.empty((height, width), np.uint8)
+        self._color_buf = np.empty((height, width, 3), np.uint8)
+        self._up_buf = np.empty((up_h, up_w, 3), np.uint8)
+        self._sharp_buf = np.empty((up_h, up_w, 3), np.uint8)
+        self._gamma_buf = np.empty((up_h, up_w, 3), np.uint8)
+        self._buffer_shape = (height, width)
+
+    def _init_cuda(self, cv2) -> bool:
+        """
+        Set up the optional CUDA path for the upscale/sharpen/gamma stages.
+        Returns False (CPU path) if OpenCV has no CUDA support or no device.
+        """
+        try:
+            if cv2.cuda.getCudaEnabledDeviceCount() == 0:
+                return False
+            # Device buffers are allocated on first use and reused afterwards
+            self._g_color = cv2.cuda_GpuMat()
+            self._g_up = cv2.cuda_GpuMat()
+            self._g_bgra = cv2.cuda_GpuMat()
+            self._g_sharp = cv2.cuda_GpuMat()
+            self._g_bgr = cv2.cuda_GpuMat()
+            self._g_gamma = cv2.cuda_GpuMat()
+            # CUDA linear filters only accept 1- or 4-channel images
+            self._g_sharpen = cv2.cuda.createLinearFilter(
+                cv2.CV_8UC4, cv2.CV_8UC4, self._sharpen_kernel
+            )
+            self._g_gamma_lut = cv2.cuda.createLookUpTable(
+                self._gamma_table.reshape(1, 256)
+            )
+        except (AttributeError, cv2.error) as e:
+            logger.debug(f"CUDA image processing unavailable: {e}")
+            return False
+
+        logger.info("Using CUDA for IR image processing")
+        return True
+
+    def _init_opencl(self, cv2) -> bool:
+        """
+        Set up OpenCV's OpenCL (UMat) path, used when CUDA is unavailable.
+        Returns False (CPU path) if no OpenCL device is present.
+        """
+        if not cv2.ocl.haveOpenCL():
+            return False
+        cv2.ocl.setUseOpenCL(True)
+        self._u_up = cv2.UMat()
+        self._u_sharp = cv2.UMat()
+        self._u_gamma = cv2.UMat()
+        logger.info("Using OpenCL for IR image processing")
+        return True
+
+    def process(self, cv2, thermal: np.ndarray) -> Tuple[np.ndarray, float, float, float]:
+        """
+        Process one raw thermal image.
+        Returns (bgr_frame, avg, min, max); the frame is an internal buffer
+        that is overwritten by the next call.
+        """
+        # Stats on the raw integers, converted to °C as scalars
+        # (minMaxLoc finds both extremes in one pass)
+        raw_min, raw_max, _, _ = cv2.minMaxLoc(thermal)
+        avg = raw_to_celsius(cv2.mean(thermal)[0])
+        tmin = raw_to_celsius(raw_min)
+        tmax = raw_to_celsius(raw_max)
+
+        # Enhanced image processing for maximum clarity
+        # 1. Adaptive temperature range smoothing (reduced alpha for faster response)
+        # With hysteresis: readings within 0.5 °C of the current range leave
+        # it (and the LUT below) untouched, which also reduces flicker
+        alpha = 0.15  # Faster adaptation for better clarity
+        rebuild_lut = self._norm_lut is None
+        if self._last_min is None:
+            self._last_min = tmin
+            self._last_max = tmax
+        else:
+            if abs(tmin - self._last_min) > 0.5:
+                self._last_min = alpha * tmin + (1 - alpha) * self._last_min
+                rebuild_lut = True
+            if abs(tmax - self._last_max) > 0.5:
+                self._last_max = alpha * tmax + (1 - alpha) * self._last_max
+                rebuild_lut = True
+
+        # 2. Enhanced dynamic normalization with better contrast
+        if rebuild_lut:
+            temp_range = self._last_max - self._last_min
+            if temp_range < 1e-6:
+                temp_range = 1.0  # Avoid division by zero
+            self._norm_lut = np.clip(
+                ((self._raw_celsius - self._last_min) / temp_range) * 255.0,
+                0, 255
+            ).astype(np.uint8)
+
+        # Scale, clip and cast in a single table lookup
+        self._ensure_buffers(*thermal.shape[:2])
+        norm = np.take(self._norm_lut, thermal, out=self._norm_buf)
+
+        # 3. Enhanced CLAHE for better local contrast
+        norm = self._clahe.apply(norm, self._clahe_buf)
+
+        # 4. Edge-preserving denoise on the single-channel image
+        # (non-local means on the colour frame was far too slow
+        # for the frame rate; this is a cheap 5x5 bilateral pass)
+        norm = cv2.bilateralFilter(norm, 5, 35, 35, dst=self._denoise_buf)
+
+        # 5. Apply high-quality colormap (INFERNO for best thermal visualization)
+        frame = cv2.applyColorMap(
+            norm, cv2.COLORMAP_INFERNO, dst=self._color_buf
+        )
+
+        # 6-8. Upscale, sharpen and gamma-correct
+        if self._enhance_gpu:
+            try:
+                frame = self._enhance_gpu(cv2, frame)
+            except cv2.error as e:
+                logger.warning(f"GPU processing failed, using CPU: {e}")
+                self._enhance_gpu = None
+                frame = self._enhance_cpu(cv2, frame)
+        else:
+            frame = self._enhance_cpu(cv2, frame)
+
+        return frame, avg, tmin, tmax
+
+    def _enhance_cpu(self, cv2, frame):
+        """Upscale, sharpen and gamma-correct a colour frame on the CPU"""
+        # Upscaling with bicubic interpolation (Qt rescales the result to
+        # the label size anyway, so Lanczos quality is not visible)
+        new_height, new_width = self._up_buf.shape[:2]
+        frame = cv2.resize(
+            frame,
+            (new_width, new_height),
+            dst=self._up_buf,
+            interpolation=cv2.INTER_CUBIC
+        )
+
+        # Enhanced sharpening for maximum clarity
+        # (unsharp mask + sharpening kernel fused into one pass)
+        frame = cv2.filter2D(
+            frame, -1, self._sharpen_kernel, dst=self._sharp_buf
+        )
+
+        # Gamma correction for better visibility
+        return cv2.LUT(frame, self._gamma_table, dst=self._gamma_buf)
+
+    def _enhance_cuda(self, cv2, frame):
+        """GPU version of _enhance_cpu"""
+        new_height, new_width = self._up_buf.shape[:2]
+        self._g_color.upload(frame)
+        cv2.cuda.resize(
+            self._g_color, (new_width, new_height),
+            dst=self._g_up, interpolation=cv2.INTER_CUBIC
+        )
+        cv2.cuda.cvtColor(self._g_up, cv2.COLOR_BGR2BGRA, dst=self._g_bgra)
+        self._g_sharpen.apply(self._g_bgra, self._g_sharp)
+        cv2.cuda.cvtColor(self._g_sharp, cv2.COLOR_BGRA2BGR, dst=self._g_bgr)
+        self._g_gamma_lut.transform(self._g_bgr, self._g_gamma)
+        return self._g_gamma.download(self._gamma_buf)
+
+    def _enhance_opencl(self, cv2, frame):
+        """OpenCL (UMat) version of _enhance_cpu"""
+        new_height, new_width = self._up_buf.shape[:2]
+        color = cv2.UMat(frame)
+        # Empty UMats come back freshly allocated on the first frame; once
+        # they have the right size they are written in place
+        self._u_up = cv2.resize(
+            color, (new_width, new_height),
+            dst=self._u_up, interpolation=cv2.INTER_CUBIC
+        )
+        self._u_sharp = cv2.filter2D(
+            self._u_up, -1, self._sharpen_kernel, dst=self._u_sharp
+        )
+        self._u_gamma = cv2.LUT(self._u_sharp, self._gamma_table, dst=self._u_gamma)
+        return self._u_gamma.get()
+
+
+class FrameSlots:
+    """
+    Numpy views onto a shared memory block holding two frame slots.
+
+    The capture process fills the slot that is not ``latest`` and then
+    flips ``latest`` under the frame lock; the reader copies the ``latest``
+    slot while holding the same lock, so a slot is never read mid-write.
+
+    Layout: latest slot index, then per-slot stats (avg, min, max), raw
+    thermal images and BGR display frames.
+    """
+
+    def __init__(self, buf, height: int, width: int, up_height: int, up_width: int):
+        self.shape = (height, width, up_height, up_width)
+        self._offset = 0
+        self.latest = self._view(buf, (1,), np.int64)
+        self.stats = [self._view(buf, (3,), np.float64) for _ in range(2)]
+        self.thermal = [self._view(buf, (height, width), np.uint16) for _ in range(2)]
+        self.bgr = [self._view(buf, (up_height, up_width, 3), np.uint8) for _ in range(2)]
+
+    def _view(self, buf, shape, dtype) -> np.ndarray:
+        arr = np.ndarray(shape, dtype, buffer=buf, offset=self._offset)
+        self._offset += arr.nbytes
+        return arr
+
+    @staticmethod
+    def nbytes(height: int, width: int, up_height: int, up_width: int) -> int:
+        """Size of the shared memory block for the given frame sizes"""
+        per_slot = 3 * 8 + height * width * 2 + up_height * up_width * 3
+        return 8 + 2 * per_slot
+
+
+def capture_process_main(
+    conn,
+    dll_paths: List[str],
+    config_paths: List[str],
+    frame_interval: float,
+    frame_lock,
+    frame_event,
+    stop_event,
+):
+    """
+    Entry point of the capture process.
+
+    Sends ("ready", shm_name, shape, dll_path, config_path) or
+    ("error", message) over conn, then writes frames into the FrameSlots
+    shared memory block and sets frame_event after each one until
+    stop_event is set.
+    """
+    # Try to import pyOptris and cv2
+    try:
+        import pyOptris
+        import cv2
+    except ImportError as e:
+        conn.send((
+            "error",
+            f"Failed to import pyOptris or cv2: {e}. "
+            "Please install: pip install opencv-python "
+            "(for Optris camera support, install pyOptris SDK)"
+        ))
+        return
+
+    camera_open = False
+    shm = None
+    slots = None
+    try:
+        # Initialize camera
+        loaded_dll_path = None
+        for dll_path in dll_paths:
+            try:
+                if os.path.exists(dll_path):
+                    pyOptris.load_DLL(dll_path)
+                    loaded_dll_path = dll_path
+                    break
+            except Exception as e:
+                logger.debug(f"Failed to load DLL from {dll_path}: {e}")
+                continue
+
+        if not loaded_dll_path:
+            raise Exception(f"Could not load Optris DLL. Tried: {dll_paths}")
+
+        loaded_config_path = None
+        for config_path in config_paths:
+            try:
+                if os.path.exists(config_path):
+                    pyOptris.usb_init(config_path)
+                    camera_open = True
+                    loaded_config_path = config_path
+                    break
+            except Exception as e:
+                logger.debug(f"Failed to load config from {config_path}: {e}")
+                continue
+
+        if not loaded_config_path:
+            raise Exception(f"Could not load Optris config. Tried: {config_paths}")
+
+        pyOptris.set_palette(pyOptris.ColouringPalette.IRON)
+        w, h = pyOptris.get_palette_image_size()
+
+        processor = IRFrameProcessor(cv2)
+        shape = (h, w, *IRFrameProcessor.upscaled_size(h, w))
+        shm = shared_memory.SharedMemory(create=True, size=FrameSlots.nbytes(*shape))
+        slots = FrameSlots(shm.buf, *shape)
+        slots.latest[0] = -1
+
+        conn.send(("ready", shm.name, shape, loaded_dll_path, loaded_config_path))
+
+        write_index = 0
+        next_frame_at = time.perf_counter()
+        while not stop_event.is_set():
+            try:
+                thermal = pyOptris.get_thermal_image(w, h)
+                frame, avg, tmin, tmax = processor.process(cv2, thermal)
+
+                # Fill the slot the reader is not using, then flip to it
+                slots.stats[write_index][:] = (avg, tmin, tmax)
+                slots.thermal[write_index][...] = thermal
+                slots.bgr[write_index][...] = frame
+                with frame_lock:
+                    slots.latest[0] = write_index
+                write_index ^= 1
+                frame_event.set()
+
+                # Sleep until the next frame slot, net of processing time
+                next_frame_at += frame_interval
+                delay = next_frame_at - time.perf_counter()
+                if delay > 0:
+                    stop_event.wait(delay)
+                else:
+                    next_frame_at = time.perf_counter()  # Behind; don't burst
+
+            except Exception as e:
+                logger.error(f"Error capturing frame: {e}")
+                stop_event.wait(0.1)
+
+    except Exception as e:
+        conn.send(("error", f"Failed to initialize IR camera: {e}"))
+    finally:
+        try:
+            if camera_open:
+                pyOptris.terminate()
+        except Exception:
+            pass
+        # Views must be released before the block can be closed
+        slots = None
+        if shm is not None:
+            shm.close()
+            shm.unlink()
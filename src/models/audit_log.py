@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Enum, JSON
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Enum, JSON, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from enum import Enum as PyEnum
@@ -77,6 +77,13 @@ class AuditLog(Base):
     # Timestamp
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
 
+    # Serves the lab activity feed: rows of the lab's users, newest first.
+    # TODO: existing databases need this in the next schema migration:
+    # CREATE INDEX ix_audit_logs_user_created ON audit_logs (user_id, created_at DESC);
+    __table_args__ = (
+        Index("ix_audit_logs_user_created", user_id, created_at.desc()),
+    )
+
     def __repr__(self):
         return f"<AuditLog(id={self.id}, action={self.action_type.value}, user_id={self.user_id})>"
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from enum import Enum as PyEnum
@@ -52,10 +52,23 @@ class User(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     last_login = Column(DateTime(timezone=True), nullable=True)
 
+    # Serves the lab member lists: active users of a lab with a given role,
+    # ordered by name.
+    # TODO: existing databases need this in the next schema migration:
+    # CREATE INDEX ix_users_lab_role_active_name ON users (lab_id, role, is_active, full_name);
+    __table_args__ = (
+        Index("ix_users_lab_role_active_name", lab_id, role, is_active, full_name),
+    )
+
+    @staticmethod
+    def hash_password(password: str) -> str:
+        """Hash a password (pure, thread-safe; the expensive bcrypt step)"""
+        salt = bcrypt.gensalt()
+        return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+
     def set_password(self, password: str):
         """Hash and set password"""
-        salt = bcrypt.gensalt()
-        self.password_hash = bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+        self.password_hash = self.hash_password(password)
 
     def check_password(self, password: str) -> bool:
         """Verify password"""
@@ -0,0 +1,41 @@
+import time
+
+from src.database import get_db_session
+from src.models import Lab
+
+
+# Process-wide cache of active labs as (name, id) tuples, shared by the
+# user dialogs so opening them does not hit the database every time.
+_active_labs: list[tuple[str, int]] | None = None
+_loaded_at = 0.0
+
+
+def get_active_labs(ttl: float = 60) -> list[tuple[str, int]]:
+    """Get active labs as (name, id) tuples, ordered by name.
+
+    Results are cached for ``ttl`` seconds; call invalidate_active_labs()
+    after creating or editing labs to force a reload.
+    """
+    global _active_labs, _loaded_at
+
+    now = time.monotonic()
+    if _active_labs is None or now - _loaded_at > ttl:
+        # TODO: add a partial index for this filter in the next schema
+        # migration: CREATE INDEX ix_labs_active ON labs (name) WHERE is_active;
+        with get_db_session() as db:
+            rows = (
+                db.query(Lab.name, Lab.id)
+                .filter(Lab.is_active.is_(True))
+                .order_by(Lab.name)
+                .all()
+            )
+        _active_labs = [(name, lab_id) for name, lab_id in rows]
+        _loaded_at = now
+
+    return _active_labs
+
+
+def invalidate_active_labs():
+    """Drop the cached lab list so the next lookup re-queries the database"""
+    global _active_labs
+    _active_labs = None
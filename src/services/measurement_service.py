@@ -5,7 +5,7 @@ import os
 import json
 
 from src.models import Measurement, MeasurementType, Workbook, User
-from src.auth import AuthManager
+from src.auth import get_auth_manager
 from src.utils import Config
 
 
@@ -13,7 +13,7 @@ class MeasurementService:
     """Service for measurement operations"""
     
     def __init__(self):
-        self.auth_manager = AuthManager()
+        self.auth_manager = get_auth_manager()
         self.config = Config()
     
     def create_measurement(self, db: Session, workbook_id: int, user: User,
@@ -1,5 +1,5 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy.orm import Session, contains_eager
+from sqlalchemy import func, and_, select
 from datetime import datetime, timedelta
 
 from src.models import (
@@ -69,6 +69,60 @@ class StatisticsService:
             ),
         }
 
+    def get_researcher_statistics_bulk(
+        self, db: Session, researcher_ids: list[int]
+    ) -> dict[int, dict]:
+        """Get card statistics for many researchers at once.
+
+        Issues one GROUP BY query each for workbooks, measurements and
+        instrument uses instead of one round of queries per researcher.
+        Researchers without any rows get zero counts.
+        """
+        stats: dict[int, dict] = {
+            rid: {
+                "total_workbooks": 0,
+                "total_measurements": 0,
+                "instrument_usage_count": 0,
+            }
+            for rid in researcher_ids
+        }
+        if not stats:
+            return stats
+
+        workbook_rows = (
+            db.query(Workbook.researcher_id, func.count(Workbook.id))
+            .filter(Workbook.researcher_id.in_(researcher_ids))
+            .group_by(Workbook.researcher_id)
+            .all()
+        )
+        for rid, count in workbook_rows:
+            stats[rid]["total_workbooks"] = count
+
+        measurement_rows = (
+            db.query(Workbook.researcher_id, func.count(Measurement.id))
+            .join(Measurement, Measurement.workbook_id == Workbook.id)
+            .filter(Workbook.researcher_id.in_(researcher_ids))
+            .group_by(Workbook.researcher_id)
+            .all()
+        )
+        for rid, count in measurement_rows:
+            stats[rid]["total_measurements"] = count
+
+        usage_rows = (
+            db.query(AuditLog.user_id, func.count(AuditLog.id))
+            .filter(
+                AuditLog.user_id.in_(researcher_ids),
+                AuditLog.action_type
+                == AuditActionType.INSTRUMENT_MEASUREMENT_COMPLETED,
+            )
+            .group_by(AuditLog.user_id)
+            .all()
+        )
+        for rid, count in usage_rows:
+            stats[rid]["instrument_usage_count"] = count
+
+        return stats
+
     def get_lab_statistics(
         self,
         db: Session,
@@ -95,6 +149,45 @@ class StatisticsService:
 
         return lab_stats
 
+    def get_lab_totals(self, db: Session, lab_id: int) -> dict:
+        """Get lab-wide researcher, workbook, measurement and instrument totals.
+
+        Counts the same rows as summing get_lab_statistics() over all
+        researchers, but in a single round trip that returns four scalars.
+        """
+        researcher_ids = select(User.id).where(
+            User.lab_id == lab_id, User.role == UserRole.RESEARCHER
+        )
+
+        row = db.execute(
+            select(
+                select(func.count())
+                .select_from(researcher_ids.subquery())
+                .scalar_subquery(),
+                select(func.count(Workbook.id))
+                .where(Workbook.researcher_id.in_(researcher_ids))
+                .scalar_subquery(),
+                select(func.count(Measurement.id))
+                .join(Workbook, Measurement.workbook_id == Workbook.id)
+                .where(Workbook.researcher_id.in_(researcher_ids))
+                .scalar_subquery(),
+                select(func.count(AuditLog.id))
+                .where(
+                    AuditLog.user_id.in_(researcher_ids),
+                    AuditLog.action_type
+                    == AuditActionType.INSTRUMENT_MEASUREMENT_COMPLETED,
+                )
+                .scalar_subquery(),
+            )
+        ).one()
+
+        return {
+            "total_researchers": row[0],
+            "total_workbooks": row[1],
+            "total_measurements": row[2],
+            "instrument_usage_count": row[3],
+        }
+
     def get_lab_activity_logs(
         self,
         db: Session,
@@ -117,9 +210,12 @@ class StatisticsService:
             AuditActionType.INSTRUMENT_MEASUREMENT_COMPLETED,
         ]
 
+        # Populate log.user from the filtering join so callers don't trigger
+        # one lazy user load per log row
         query = (
             db.query(AuditLog)
-            .join(User, AuditLog.user_id == User.id)
+            .join(AuditLog.user)
+            .options(contains_eager(AuditLog.user))
             .filter(User.lab_id == lab_id, AuditLog.action_type.in_(relevant_actions))
         )
 
@@ -133,6 +229,29 @@ class StatisticsService:
         )
         return logs
 
+    def get_lab_activity_feed_rows(
+        self,
+        db: Session,
+        lab_id: int,
+        since: datetime | None = None,
+        limit: int = 50,
+    ) -> list[tuple[str, str, str, str]]:
+        """Get recent lab activity as display-ready rows.
+
+        Each row is a (time, researcher name, action, details) tuple of
+        strings, so the activity table only has to hand them to Qt.
+        """
+        logs = self.get_lab_activity_logs(db, lab_id, since=since, limit=limit)
+        return [
+            (
+                log.created_at.strftime("%Y-%m-%d %H:%M") if log.created_at else "",
+                (log.user.full_name or log.user.username) if log.user else "System",
+                log.action_type.value.replace("_", " ").title(),
+                log.description or "",
+            )
+            for log in logs
+        ]
+
     def get_system_statistics(self, db: Session) -> dict:
         """Get system-wide statistics."""
         total_users = db.query(User).filter(User.is_active == True).count()  # noqa: E712
@@ -144,7 +263,7 @@ class StatisticsService:
             )
             .count()
         )
-        total_labs = db.query(Lab).filter(Lab.is_active == True).count()  # noqa: E712
+        total_labs = db.query(Lab).filter(Lab.is_active.is_(True)).count()
         total_workbooks = (
             db.query(Workbook).filter(Workbook.is_active == True).count()  # noqa: E712
         )
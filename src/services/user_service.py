@@ -2,14 +2,14 @@ from sqlalchemy.orm import Session
 from sqlalchemy import and_
 
 from src.models import User, UserRole, Lab
-from src.auth import AuthManager
+from src.auth import get_auth_manager
 
 
 class UserService:
     """Service for user management operations (super admin only)"""
     
     def __init__(self):
-        self.auth_manager = AuthManager()
+        self.auth_manager = get_auth_manager()
     
     def create_user(self, db: Session, creator: User, username: str, email: str,
                    full_name: str, password: str, role: UserRole, lab_id: int = None) -> User:
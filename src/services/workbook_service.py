@@ -2,14 +2,14 @@ from sqlalchemy.orm import Session
 from datetime import datetime
 
 from src.models import Workbook, User
-from src.auth import AuthManager
+from src.auth import get_auth_manager
 
 
 class WorkbookService:
     """Service for workbook operations"""
     
     def __init__(self):
-        self.auth_manager = AuthManager()
+        self.auth_manager = get_auth_manager()
     
     def create_workbook(self, db: Session, user: User, title: str, sample_name: str = None, 
                        sample_id: str = None, description: str = None) -> Workbook:
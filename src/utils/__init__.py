@@ -1,5 +1,6 @@
 from .config_loader import Config
 from .matplotlib_config import configure_cjk_fonts
+from .password_generator import generate_password
 
-__all__ = ['Config', 'configure_cjk_fonts']
+__all__ = ['Config', 'configure_cjk_fonts', 'generate_password']
 
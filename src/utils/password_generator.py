@@ -0,0 +1,29 @@
+"""
+Random password generation for admin-created accounts
+"""
+import secrets
+import string
+
+
+_ALPHABET = (string.ascii_letters + string.digits).encode()
+_ALPHABET_SIZE = len(_ALPHABET)
+# Bytes at or above this value are discarded so that `b % _ALPHABET_SIZE`
+# stays uniform (256 is not a multiple of 62)
+_BYTE_LIMIT = 256 - 256 % _ALPHABET_SIZE
+
+
+def generate_password(min_len: int = 8, max_len: int = 16) -> str:
+    """
+    Generate a random alphanumeric password of min_len..max_len characters.
+    Characters are drawn from one OS RNG read rather than one call per char.
+    """
+    length = min_len + secrets.randbelow(max_len - min_len + 1)
+
+    chars = bytearray()
+    while len(chars) < length:
+        chars += bytes(
+            _ALPHABET[b % _ALPHABET_SIZE]
+            for b in secrets.token_bytes(length)
+            if b < _BYTE_LIMIT
+        )
+    return chars[:length].decode()